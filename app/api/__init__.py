@@ -1,4 +1,13 @@
+from app.api.documents import limit_upload_size
 from app.api.documents import router as documents_router
 from app.api.extractions import router as extractions_router
+from app.api.metrics import router as metrics_router
+from app.api.records import router as records_router
 
-__all__ = ["documents_router", "extractions_router"]
+__all__ = [
+    "documents_router",
+    "extractions_router",
+    "limit_upload_size",
+    "metrics_router",
+    "records_router",
+]
@@ -1,13 +1,45 @@
-from fastapi import APIRouter, Depends, UploadFile, status
+from collections.abc import Awaitable, Callable
+
+from fastapi import APIRouter, Depends, Request, Response, UploadFile, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import metrics
+from app.core.config import get_settings
 from app.db import get_db
 from app.schemas.document import DocumentsUploadResponse
 from app.services import document_service
 
+settings = get_settings()
+
 router = APIRouter(prefix="/documents", tags=["documents"])
 
 
+async def limit_upload_size(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]],
+) -> Response:
+    """
+    HTTP middleware rejecting oversized uploads from their Content-Length.
+
+    The multipart parser spools every file to disk before the route runs, so
+    the per-file MAX_UPLOAD_SIZE_BYTES check cannot stop a large body from
+    being received. This runs first and answers 413 without reading the body
+    when the declared size exceeds MAX_UPLOAD_REQUEST_BYTES.
+    """
+    if request.method == "POST" and request.url.path.rstrip("/") == router.prefix:
+        content_length = request.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > settings.MAX_UPLOAD_REQUEST_BYTES:
+            return JSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                content={
+                    "detail": "Upload request exceeds the maximum size of "
+                    f"{settings.MAX_UPLOAD_REQUEST_BYTES} bytes"
+                },
+            )
+    return await call_next(request)
+
+
 @router.post(
     "",
     response_model=DocumentsUploadResponse,
@@ -18,4 +50,5 @@ async def upload_documents(
     db: AsyncSession = Depends(get_db),
 ) -> DocumentsUploadResponse:
     """Upload one or more files."""
-    return await document_service.upload_documents(files, db)
+    with metrics.DOCUMENT_UPLOAD_DURATION_SECONDS.time():
+        return await document_service.upload_documents(files, db)
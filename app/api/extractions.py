@@ -1,17 +1,23 @@
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_db
+from app.core.config import get_settings
+from app.db import get_db, get_read_db, pin_to_primary
 from app.schemas.extraction import (
     CreateExtractionRequest,
     ExtractionCreateResponse,
     ExtractionOut,
+    ExtractionStatusBatchRequest,
+    ExtractionStatusBatchResponse,
 )
 from app.schemas.extraction_record import ExtractionRecordsResponse
 from app.services import extraction_service
 
+settings = get_settings()
+
 router = APIRouter(prefix="/extractions", tags=["extractions"])
 
 
@@ -22,38 +28,113 @@ router = APIRouter(prefix="/extractions", tags=["extractions"])
 )
 async def create_extraction(
     body: CreateExtractionRequest,
-    background_tasks: BackgroundTasks,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ) -> ExtractionCreateResponse:
-    """Create a new extraction job for the specified documents."""
+    """
+    Create a new extraction job for the specified documents.
+
+    The job is enqueued as a PENDING row and picked up by an extraction worker.
+    The client's reads stay on the primary for a short while so the new job is
+    visible to it even when replicas lag.
+    """
     extraction = await extraction_service.create_extraction(body.document_ids, db)
-    background_tasks.add_task(extraction_service.process_extraction, extraction.id)
+    pin_to_primary(response)
     return ExtractionCreateResponse.from_extraction(extraction)
 
 
+@router.post(
+    "/status",
+    response_model=ExtractionStatusBatchResponse,
+)
+async def get_extractions_status(
+    body: ExtractionStatusBatchRequest,
+    db: AsyncSession = Depends(get_read_db),
+) -> ExtractionStatusBatchResponse:
+    """Get the status of many extraction jobs in one request."""
+    return await extraction_service.get_extractions_status(body.extraction_ids, db)
+
+
 @router.get(
     "/{extraction_id}",
     response_model=ExtractionOut,
 )
 async def get_extraction(
     extraction_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
+    primary_db: AsyncSession = Depends(get_db),
+    wait: int | None = Query(
+        default=None,
+        ge=1,
+        le=settings.LONG_POLL_MAX_WAIT_SECONDS,
+        description="Long-poll: seconds to wait for the status to change",
+    ),
 ) -> ExtractionOut:
-    """Get the status of an extraction job."""
+    """
+    Get the status of an extraction job.
+
+    Long-polls read from the primary: they wake on a status event sent when
+    the primary commits, which a replica may not have replayed yet.
+    """
+    if wait:
+        return await extraction_service.wait_for_extraction(
+            extraction_id, primary_db, wait
+        )
     return await extraction_service.get_extraction(extraction_id, db)
 
 
+@router.get(
+    "/{extraction_id}/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_extraction_events(
+    extraction_id: UUID,
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Stream status changes of an extraction job as Server-Sent Events.
+
+    Reads from the primary, like long-polls, so the status re-read after an
+    event is never older than the event.
+    """
+    events = await extraction_service.stream_extraction_events(extraction_id, db)
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get(
     "/{extraction_id}/records",
     response_model=ExtractionRecordsResponse,
 )
 async def get_extraction_records(
     extraction_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     limit: int = Query(default=50, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(
+        default=None,
+        description="Opaque `next_cursor` from the previous page; takes precedence over offset",
+    ),
 ) -> ExtractionRecordsResponse:
     """Get extraction records with optional pagination."""
     return await extraction_service.get_extraction_records(
-        extraction_id, db, limit=limit, offset=offset
+        extraction_id, db, limit=limit, offset=offset, cursor=cursor
     )
+
+
+@router.get(
+    "/{extraction_id}/records/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def export_extraction_records(
+    extraction_id: UUID,
+    db: AsyncSession = Depends(get_read_db),
+) -> StreamingResponse:
+    """Stream all extraction records as newline-delimited JSON."""
+    chunks = await extraction_service.export_extraction_records(extraction_id, db)
+    return StreamingResponse(chunks, media_type="application/x-ndjson")
@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Depends, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import get_db
+from app.services import extraction_service
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("", include_in_schema=False)
+async def get_metrics(db: AsyncSession = Depends(get_db)) -> Response:
+    """Expose Prometheus metrics, refreshing job counts from the database."""
+    await extraction_service.update_job_metrics(db)
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
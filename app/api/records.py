@@ -0,0 +1,45 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import get_read_db
+from app.schemas.extraction_record import ExtractionRecordSearchResponse
+from app.services import extraction_service
+
+router = APIRouter(prefix="/records", tags=["records"])
+
+
+@router.get(
+    "/search",
+    response_model=ExtractionRecordSearchResponse,
+)
+async def search_records(
+    field: str = Query(min_length=1, description="Extracted field name, e.g. `amount`"),
+    value: str | None = Query(default=None, description="Exact extracted value"),
+    min_confidence: float | None = Query(default=None, ge=0, le=1),
+    max_confidence: float | None = Query(default=None, ge=0, le=1),
+    extraction_id: UUID | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=1000),
+    cursor: str | None = Query(
+        default=None,
+        description="Opaque `next_cursor` from the previous page",
+    ),
+    db: AsyncSession = Depends(get_read_db),
+) -> ExtractionRecordSearchResponse:
+    """
+    Search extracted records across extractions.
+
+    Filters by field name, exact value and confidence range, optionally
+    within one extraction, ordered oldest first.
+    """
+    return await extraction_service.search_records(
+        field,
+        db,
+        value=value,
+        min_confidence=min_confidence,
+        max_confidence=max_confidence,
+        extraction_id=extraction_id,
+        limit=limit,
+        cursor=cursor,
+    )
@@ -0,0 +1,114 @@
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from uuid import UUID
+
+from app.core.config import get_settings
+from app.core.exceptions import AppException
+from app.db import async_session_factory, dispose_engines, init_db, partitions
+from app.services import export_service, result_cache
+
+settings = get_settings()
+
+
+async def export_records(args: argparse.Namespace) -> None:
+    output = args.output or Path(f"{args.extraction_id}.{args.format}")
+    async with async_session_factory() as db:
+        written = await export_service.export_records(
+            args.extraction_id, output, args.format, db
+        )
+    print(f"Wrote {written} records to {output}")
+
+
+async def purge_cache(args: argparse.Namespace) -> None:
+    async with async_session_factory() as db:
+        removed = await result_cache.purge_expired(db)
+        await db.commit()
+    print(f"Removed {removed} expired cache entries")
+
+
+async def maintain_partitions(args: argparse.Namespace) -> None:
+    async with async_session_factory() as db:
+        if db.get_bind().dialect.name != "postgresql":
+            print("Record partitions are only used on Postgres", file=sys.stderr)
+            return
+        created = await partitions.ensure_partitions(args.months_ahead, db)
+        removed = await partitions.apply_retention(
+            args.retention_months, args.retention_action, db
+        )
+        await db.commit()
+    print(f"Created {len(created)} partitions: {', '.join(created) or '-'}")
+    print(f"Applied retention to {len(removed)} partitions: {', '.join(removed) or '-'}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    export = subcommands.add_parser(
+        "export-records",
+        help="Export an extraction's records to CSV or Parquet",
+    )
+    export.add_argument("extraction_id", type=UUID)
+    export.add_argument(
+        "--format",
+        choices=export_service.EXPORT_FORMATS,
+        default="parquet",
+    )
+    export.add_argument(
+        "--output",
+        type=Path,
+        help="Defaults to <extraction_id>.<format>",
+    )
+    export.set_defaults(handler=export_records)
+
+    purge = subcommands.add_parser(
+        "purge-cache",
+        help="Delete expired extraction result cache entries",
+    )
+    purge.set_defaults(handler=purge_cache)
+
+    partition = subcommands.add_parser(
+        "partitions",
+        help="Create upcoming extraction_records partitions and apply retention",
+    )
+    partition.add_argument(
+        "--months-ahead",
+        type=int,
+        default=settings.RECORD_PARTITION_MONTHS_AHEAD,
+    )
+    partition.add_argument(
+        "--retention-months",
+        type=int,
+        default=settings.RECORD_RETENTION_MONTHS,
+        help="Keep this many past months (0 keeps everything)",
+    )
+    partition.add_argument(
+        "--retention-action",
+        choices=("detach", "drop"),
+        default=settings.RECORD_RETENTION_ACTION,
+    )
+    partition.set_defaults(handler=maintain_partitions)
+
+    return parser
+
+
+async def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if settings.DATABASE_BACKEND == "memory":
+        print("DATABASE_BACKEND=memory keeps no data between processes", file=sys.stderr)
+        return 1
+    try:
+        await init_db()
+        await args.handler(args)
+    except (AppException, ImportError) as e:
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        await dispose_engines()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
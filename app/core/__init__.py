@@ -2,9 +2,14 @@ from app.core.config import Settings, get_settings
 from app.core.exceptions import (
     AppException,
     DocumentNotFoundError,
+    DocumentTooLargeError,
     DocumentUploadError,
     EmptyFilesError,
+    ExtractionLeaseLostError,
     ExtractionNotFoundError,
+    ExtractionQueueFullError,
+    InvalidConfidenceRangeError,
+    InvalidCursorError,
     NotFoundError,
     ValidationError,
 )
@@ -17,6 +22,11 @@ __all__ = [
     "ValidationError",
     "DocumentNotFoundError",
     "ExtractionNotFoundError",
+    "ExtractionQueueFullError",
+    "ExtractionLeaseLostError",
     "DocumentUploadError",
+    "DocumentTooLargeError",
     "EmptyFilesError",
+    "InvalidCursorError",
+    "InvalidConfidenceRangeError",
 ]
@@ -1,6 +1,8 @@
 from functools import lru_cache
 from pathlib import Path
+from typing import Literal
 
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Get the directory where this config file lives
@@ -35,16 +37,125 @@ class Settings(BaseSettings):
     ENV: str
     LOG_LEVEL: str
 
-    # Database
-    DATABASE_URL: str
+    # Database: "postgres" connects to DATABASE_URL (required then), "sqlite" to a
+    # local file at SQLITE_PATH (tests, benchmarks, laptops without Docker), and
+    # "memory" keeps everything in the API process, to profile the services
+    # without any database latency
+    DATABASE_BACKEND: Literal["postgres", "sqlite", "memory"] = "postgres"
+    DATABASE_URL: str = ""
+    SQLITE_PATH: str = "extraction.db"
+    # Connection pools. The API and the extraction worker get separate engines, so
+    # background extraction can never starve request handlers of connections
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    # Test connections on checkout (one extra round trip); when off, stale connections
+    # are only replaced by DB_POOL_RECYCLE_SECONDS or after a failed query
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: bool = False
+    # asyncpg prepared statements cached per connection (0 behind PgBouncer in transaction mode)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # Server-side statement_timeout (0 = no limit)
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    WORKER_DB_POOL_SIZE: int = 5
+    WORKER_DB_MAX_OVERFLOW: int = 5
+    WORKER_DB_STATEMENT_TIMEOUT_MS: int = 0
+    # Read replicas (JSON list of URLs) serve read-only endpoints round-robin. After
+    # POST /extractions a client reads from the primary for READ_YOUR_WRITES_SECONDS
+    DATABASE_REPLICA_URLS: list[str] = []
+    READ_YOUR_WRITES_SECONDS: int = 5
 
     # Storage
     STORAGE_DIR: str
+    UPLOAD_CHUNK_SIZE_BYTES: int = 1024 * 1024
+    MAX_UPLOAD_SIZE_BYTES: int = 100 * 1024 * 1024
+    # Whole POST /documents body, checked from Content-Length before it is read
+    MAX_UPLOAD_REQUEST_BYTES: int = 100 * 1024 * 1024
+
+    # Extraction worker
+    WORKER_POLL_INTERVAL_MS: int = 1000
+    WORKER_BATCH_SIZE: int = 10
+    # Both at least 1; a queue of size 0 would be unbounded and never get a claim
+    WORKER_CONCURRENCY: int = Field(default=4, ge=1)
+    WORKER_QUEUE_SIZE: int = Field(default=4, ge=1)
+    # On shutdown, running jobs get this long to finish before being put back to PENDING
+    WORKER_DRAIN_TIMEOUT_SECONDS: int = 30
+    # Port of the worker's Prometheus endpoint (0 disables it)
+    WORKER_METRICS_PORT: int = 0
+
+    # Documents written and committed per transaction while processing a job,
+    # and how many of them are extracted concurrently
+    EXTRACTION_BATCH_SIZE: int = 50
+    EXTRACTION_DOCUMENT_CONCURRENCY: int = 16
+
+    # Extractor engine; CPU-bound engines run in a process pool (0 = one process per CPU)
+    EXTRACTOR_ENGINE: str = "mock"
+    EXTRACTOR_PROCESS_POOL_SIZE: int = 0
+    EXTRACTOR_TIMEOUT_SECONDS: float = 120.0
+
+    # Documents with more pages than the threshold are split into chunks of
+    # CHUNK_PAGES pages that are extracted and committed independently
+    CHUNK_PAGE_THRESHOLD: int = 50
+    CHUNK_PAGES: int = 25
+
+    # Extraction result cache, keyed by document content hash and extractor version
+    RESULT_CACHE_ENABLED: bool = True
+    RESULT_CACHE_TTL_SECONDS: int = 7 * 24 * 60 * 60
+    RESULT_CACHE_MEMORY_SIZE: int = 10_000
+
+    # Run the extraction worker inside the API process (single-process mode)
+    EMBEDDED_WORKER: bool = False
+
+    # Status change events: Postgres LISTEN/NOTIFY across processes, or an
+    # in-process broadcaster when the API runs with EMBEDDED_WORKER
+    STATUS_EVENTS_BACKEND: Literal["postgres", "memory"] = "postgres"
+    STATUS_EVENTS_CHANNEL: str = "extraction_status"
+    LONG_POLL_MAX_WAIT_SECONDS: int = 60
+    SSE_HEARTBEAT_SECONDS: int = 15
+
+    # Rows fetched per server-side cursor round trip when exporting records
+    EXPORT_BATCH_SIZE: int = 1000
+    EXPORT_PARQUET_ROW_GROUP_SIZE: int = 100_000
+
+    # extraction_records is range-partitioned by month on created_at (Postgres);
+    # `python -m app.cli partitions` creates upcoming partitions and applies
+    # retention by detaching (archive) or dropping whole months (0 = keep forever)
+    RECORD_PARTITION_MONTHS_AHEAD: int = 3
+    RECORD_RETENTION_MONTHS: int = 0
+    RECORD_RETENTION_ACTION: Literal["detach", "drop"] = "detach"
+
+    # Job leases: workers heartbeat running jobs, and the reaper re-queues jobs
+    # whose lease expired, with exponential backoff, up to JOB_MAX_ATTEMPTS
+    JOB_LEASE_SECONDS: int = 60
+    JOB_HEARTBEAT_SECONDS: int = 15
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_BACKOFF_SECONDS: int = 30
+    REAPER_INTERVAL_SECONDS: int = 30
+
+    # Backpressure on job creation (0 disables the limit)
+    MAX_PENDING_EXTRACTIONS: int = 1000
+    EXTRACTION_RETRY_AFTER_SECONDS: int = 5
 
     # Mock AI behavior
     MOCK_AI_DELAY_MS: int
     RECORDS_PER_DOCUMENT: int
 
+    @model_validator(mode="after")
+    def _check_database_url(self) -> "Settings":
+        if self.DATABASE_BACKEND == "postgres" and not self.DATABASE_URL:
+            raise ValueError("DATABASE_BACKEND=postgres requires DATABASE_URL")
+        return self
+
+    @model_validator(mode="after")
+    def _check_status_events_backend(self) -> "Settings":
+        # LISTEN/NOTIFY only exists on Postgres
+        if self.DATABASE_BACKEND != "postgres" and self.STATUS_EVENTS_BACKEND == "postgres":
+            raise ValueError(
+                f"DATABASE_BACKEND={self.DATABASE_BACKEND} requires STATUS_EVENTS_BACKEND=memory"
+            )
+        return self
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -1,7 +1,13 @@
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
-from app.core.exceptions import DocumentUploadError, NotFoundError, ValidationError
+from app.core.exceptions import (
+    DocumentTooLargeError,
+    DocumentUploadError,
+    ExtractionQueueFullError,
+    NotFoundError,
+    ValidationError,
+)
 
 
 async def not_found_handler(request: Request, exc: NotFoundError) -> JSONResponse:
@@ -30,3 +36,24 @@ async def document_upload_error_handler(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": exc.message},
     )
+
+
+async def document_too_large_handler(
+    request: Request, exc: DocumentTooLargeError
+) -> JSONResponse:
+    """Handle DocumentTooLargeError exceptions."""
+    return JSONResponse(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        content={"detail": exc.message},
+    )
+
+
+async def extraction_queue_full_handler(
+    request: Request, exc: ExtractionQueueFullError
+) -> JSONResponse:
+    """Handle ExtractionQueueFullError exceptions."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": exc.message},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
@@ -38,6 +38,22 @@ class ExtractionNotFoundError(NotFoundError):
         super().__init__(f"Extraction not found: {extraction_id}")
 
 
+class ExtractionQueueFullError(AppException):
+    """Raised when too many extraction jobs are waiting to be processed."""
+
+    def __init__(self, retry_after: int):
+        self.retry_after = retry_after
+        super().__init__("Extraction queue is full, retry later")
+
+
+class ExtractionLeaseLostError(AppException):
+    """Raised when a worker no longer holds the lease of the job it is running."""
+
+    def __init__(self, extraction_id: UUID):
+        self.extraction_id = extraction_id
+        super().__init__(f"Lease of extraction {extraction_id} was lost")
+
+
 class DocumentUploadError(AppException):
     """Raised when document upload fails."""
 
@@ -46,6 +62,35 @@ class DocumentUploadError(AppException):
         super().__init__(f"Failed to upload {filename}: {reason}")
 
 
+class DocumentTooLargeError(AppException):
+    """Raised when an uploaded file exceeds the configured size limit."""
+
+    def __init__(self, filename: str, max_bytes: int):
+        self.filename = filename
+        self.max_bytes = max_bytes
+        super().__init__(f"File {filename} exceeds the maximum size of {max_bytes} bytes")
+
+
+class InvalidCursorError(ValidationError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(f"Invalid pagination cursor: {cursor}")
+
+
+class InvalidConfidenceRangeError(ValidationError):
+    """Raised when a record search asks for an empty confidence range."""
+
+    def __init__(self, min_confidence: float, max_confidence: float):
+        self.min_confidence = min_confidence
+        self.max_confidence = max_confidence
+        super().__init__(
+            f"min_confidence ({min_confidence}) must not exceed "
+            f"max_confidence ({max_confidence})"
+        )
+
+
 class EmptyFilesError(ValidationError):
     """Raised when no files are provided for upload."""
 
@@ -0,0 +1,107 @@
+import time
+from collections.abc import Awaitable, Callable, Iterator
+
+from fastapi import Request, Response
+from prometheus_client import Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import REGISTRY, Collector
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+# HTTP
+HTTP_REQUEST_DURATION_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling HTTP requests, by router",
+    ["router", "method", "status"],
+)
+
+# Uploads
+DOCUMENT_UPLOAD_SIZE_BYTES = Histogram(
+    "document_upload_size_bytes",
+    "Size of each uploaded document",
+    buckets=[2**n for n in range(10, 32, 2)],
+)
+DOCUMENT_UPLOAD_DURATION_SECONDS = Histogram(
+    "document_upload_duration_seconds",
+    "Time spent hashing, storing and persisting an upload request",
+)
+
+# Extraction jobs
+EXTRACTION_PHASE_DURATION_SECONDS = Histogram(
+    "extraction_phase_duration_seconds",
+    "Time spent per batch in each phase of process_extraction",
+    ["phase"],
+)
+EXTRACTION_JOBS = Gauge(
+    "extraction_jobs",
+    "Extractions by status; PENDING is the depth of the job queue",
+    ["status"],
+)
+
+# Extraction worker
+WORKER_QUEUE_DEPTH = Gauge(
+    "worker_queue_depth",
+    "Claimed extractions buffered in the worker, waiting for a free slot",
+)
+WORKER_JOBS_IN_FLIGHT = Gauge(
+    "worker_jobs_in_flight",
+    "Extractions the worker is processing right now",
+)
+
+
+class PoolCollector(Collector):
+    """Report SQLAlchemy connection pool utilization at scrape time."""
+
+    def __init__(self, engines: dict[str, AsyncEngine]):
+        self._engines = engines
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        size = GaugeMetricFamily(
+            "db_pool_size", "Connections the pool keeps open", labels=["engine"]
+        )
+        checked_out = GaugeMetricFamily(
+            "db_pool_checked_out", "Connections currently in use", labels=["engine"]
+        )
+        overflow = GaugeMetricFamily(
+            "db_pool_overflow",
+            "Connections opened beyond the pool size",
+            labels=["engine"],
+        )
+        for name, engine in self._engines.items():
+            pool = engine.pool
+            if not isinstance(pool, QueuePool):
+                continue
+            size.add_metric([name], pool.size())
+            checked_out.add_metric([name], pool.checkedout())
+            overflow.add_metric([name], max(pool.overflow(), 0))
+        yield size
+        yield checked_out
+        yield overflow
+
+
+def register_pool_metrics(engines: dict[str, AsyncEngine]) -> None:
+    """Expose pool utilization of the given engines, keyed by label."""
+    REGISTRY.register(PoolCollector(engines))
+
+
+async def track_request_latency(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]],
+) -> Response:
+    """
+    HTTP middleware observing request latency per router.
+
+    The router label is the matched route's first tag, so routers added
+    later are picked up automatically; untagged or unmatched requests count
+    as "none".
+    """
+    started = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    tags = getattr(route, "tags", None)
+    HTTP_REQUEST_DURATION_SECONDS.labels(
+        router=tags[0] if tags else "none",
+        method=request.method,
+        status=response.status_code,
+    ).observe(time.perf_counter() - started)
+    return response
@@ -0,0 +1,27 @@
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
+from app.core.exceptions import InvalidCursorError
+
+
+def encode_cursor(created_at: datetime, record_id: UUID) -> str:
+    """Encode a keyset position as an opaque, URL-safe cursor."""
+    payload = json.dumps([created_at.isoformat(), str(record_id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, record_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(record_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(cursor) from e
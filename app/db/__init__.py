@@ -1,11 +1,32 @@
-from app.db.base import Base, TimestampMixin, UUIDMixin
-from app.db.session import async_session_factory, engine, get_db
+from app.db.base import Base, JSONType, TimestampMixin, UUIDMixin
+from app.db.session import (
+    async_session_factory,
+    build_engine,
+    dispose_engines,
+    engine,
+    get_db,
+    get_read_db,
+    init_db,
+    pin_to_primary,
+    replica_engines,
+    worker_engine,
+    worker_session_factory,
+)
 
 __all__ = [
     "Base",
+    "JSONType",
     "TimestampMixin",
     "UUIDMixin",
     "async_session_factory",
+    "build_engine",
+    "dispose_engines",
     "engine",
     "get_db",
+    "get_read_db",
+    "init_db",
+    "pin_to_primary",
+    "replica_engines",
+    "worker_engine",
+    "worker_session_factory",
 ]
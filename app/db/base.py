@@ -1,9 +1,101 @@
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, func
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy import JSON, DateTime, Float, String, Uuid
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+# JSONB on Postgres, plain JSON on other backends (e.g. the SQLite benchmark database)
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+class utcnow(FunctionElement):
+    """Server-side current timestamp, `now()` on Postgres."""
+
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw):
+    return "now()"
+
+
+@compiles(utcnow, "sqlite")
+def _compile_utcnow_sqlite(element, compiler, **kw):
+    # CURRENT_TIMESTAMP has second precision; match SQLAlchemy's microsecond
+    # storage format so keyset comparisons on timestamps stay exact
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+class json_text(FunctionElement):
+    """
+    A top-level JSON member as text, `column ->> 'key'` on Postgres.
+
+    Unlike `column["key"].as_string()` the key is rendered inline rather than
+    bound, so queries and expression indexes built from it are identical and
+    Postgres can match them under generic (prepared statement) plans too.
+    """
+
+    type = String()
+    inherit_cache = True
+    _traverse_internals = FunctionElement._traverse_internals + [
+        ("key", InternalTraversal.dp_string)
+    ]
+
+    def __init__(self, column, key: str):
+        self.key = key
+        super().__init__(column)
+
+
+def _quote(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+@compiles(json_text)
+def _compile_json_text(element, compiler, **kw):
+    return f"({compiler.process(element.clauses, **kw)} ->> {_quote(element.key)})"
+
+
+@compiles(json_text, "sqlite")
+def _compile_json_text_sqlite(element, compiler, **kw):
+    path = '$."' + element.key + '"'
+    return f"json_extract({compiler.process(element.clauses, **kw)}, {_quote(path)})"
+
+
+class json_number(json_text):
+    """
+    A top-level JSON member as a float, NULL unless it is a JSON number.
+
+    Guarded rather than cast, so a value like "high" can never make a query,
+    or an insert maintaining an expression index built from it, fail.
+    """
+
+    type = Float()
+    inherit_cache = True
+
+
+@compiles(json_number)
+def _compile_json_number(element, compiler, **kw):
+    column = compiler.process(element.clauses, **kw)
+    key = _quote(element.key)
+    return (
+        f"(CASE WHEN jsonb_typeof({column} -> {key}) = 'number' "
+        f"THEN CAST({column} ->> {key} AS DOUBLE PRECISION) END)"
+    )
+
+
+@compiles(json_number, "sqlite")
+def _compile_json_number_sqlite(element, compiler, **kw):
+    column = compiler.process(element.clauses, **kw)
+    path = _quote('$."' + element.key + '"')
+    return (
+        f"(CASE WHEN json_type({column}, {path}) IN ('integer', 'real') "
+        f"THEN json_extract({column}, {path}) END)"
+    )
 
 
 class Base(DeclarativeBase):
@@ -16,7 +108,7 @@ class UUIDMixin:
     """Mixin that provides a UUID primary key."""
 
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True),
+        Uuid(as_uuid=True),
         primary_key=True,
         default=uuid4,
     )
@@ -27,12 +119,12 @@ class TimestampMixin:
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        server_default=func.now(),
+        server_default=utcnow(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
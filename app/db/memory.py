@@ -0,0 +1,351 @@
+"""
+In-process storage behind DATABASE_BACKEND=memory.
+
+Committed rows live in a MemoryStore as plain dicts, keyed by primary key.
+The repositories in app.repositories.memory read and write them through a
+MemorySession, which stands in for AsyncSession in the services, so service
+code runs unchanged without SQL compilation, a driver or a database server.
+"""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Callable, Hashable, Iterable
+from datetime import datetime, timezone
+from functools import cache
+from typing import Any, TypeVar
+
+from sqlalchemy import DateTime, inspect
+
+from app.db.base import Base
+
+Row = dict[str, Any]
+Key = tuple[Any, ...]
+ModelT = TypeVar("ModelT", bound=Base)
+ListenerT = TypeVar("ListenerT", bound=Callable[..., None])
+
+# Per-job lookups go through these instead of scanning the whole table
+_INDEXED_COLUMNS = {
+    "extraction_chunks": "extraction_id",
+    "extraction_documents": "extraction_id",
+    "extraction_records": "extraction_id",
+}
+
+_listeners: dict[str, list[Callable[..., None]]] = defaultdict(list)
+
+
+def listens_for(identifier: str) -> Callable[[ListenerT], ListenerT]:
+    """
+    Decorate a function to be called on a MemorySession event.
+
+    Mirrors the Session events of the same name: "after_commit" listeners
+    get the session, "after_soft_rollback" listeners the session and None.
+    """
+
+    def decorator(fn: ListenerT) -> ListenerT:
+        _listeners[identifier].append(fn)
+        return fn
+
+    return decorator
+
+
+@cache
+def _column_keys(model: type[Base]) -> tuple[str, ...]:
+    return tuple(attr.key for attr in inspect(model).column_attrs)
+
+
+@cache
+def _primary_key(model: type[Base]) -> tuple[str, ...]:
+    return tuple(column.key for column in inspect(model).primary_key)
+
+
+def _key(model: type[Base], row: Row) -> Key:
+    return tuple(row[name] for name in _primary_key(model))
+
+
+def _values(obj: Base) -> Row:
+    return {name: getattr(obj, name) for name in _column_keys(type(obj))}
+
+
+def with_defaults(model: type[Base], values: Row, now: datetime) -> Row:
+    """Fill unset columns the way an INSERT would, from column and server defaults."""
+    row = dict.fromkeys(_column_keys(model))
+    row.update(values)
+    for column in model.__table__.columns:
+        if row[column.key] is not None:
+            continue
+        if column.default is not None:
+            default = column.default
+            row[column.key] = default.arg(None) if default.is_callable else default.arg
+        elif column.server_default is not None and isinstance(column.type, DateTime):
+            row[column.key] = now
+    return row
+
+
+class MemoryStore:
+    """Committed rows of every table, keyed by primary key."""
+
+    def __init__(self) -> None:
+        self._tables: dict[str, dict[Key, Row]] = defaultdict(dict)
+        self._indexes: dict[str, dict[Any, dict[Key, Row]]] = defaultdict(
+            lambda: defaultdict(dict)
+        )
+        self._locks: dict[Hashable, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    def get(self, table: str, key: Key) -> Row | None:
+        return self._tables[table].get(key)
+
+    def rows(
+        self, table: str, column: str | None = None, value: Any = None
+    ) -> list[tuple[Key, Row]]:
+        """Rows of `table`, only those whose `column` equals `value` if given."""
+        if column is None:
+            return list(self._tables[table].items())
+        if _INDEXED_COLUMNS.get(table) == column:
+            return list(self._indexes[table][value].items())
+        return [(k, row) for k, row in self._tables[table].items() if row[column] == value]
+
+    def insert(self, table: str, key: Key, row: Row, replace: bool = False) -> None:
+        if key in self._tables[table] and not replace:
+            raise ValueError(f"Duplicate key {key} in {table}")
+        self._tables[table][key] = row
+        if column := _INDEXED_COLUMNS.get(table):
+            self._indexes[table][row[column]][key] = row
+
+    def update(self, table: str, key: Key, changes: Row) -> None:
+        # Rows deleted in the meantime stay deleted, as with UPDATE
+        row = self._tables[table].get(key)
+        if row is not None:
+            row.update(changes)
+
+    def delete(self, table: str, key: Key) -> None:
+        row = self._tables[table].pop(key, None)
+        if row is not None and (column := _INDEXED_COLUMNS.get(table)):
+            self._indexes[table][row[column]].pop(key, None)
+
+    def lock(self, name: Hashable) -> asyncio.Lock:
+        return self._locks[name]
+
+
+class MemorySession:
+    """
+    A unit of work over a MemoryStore, standing in for AsyncSession.
+
+    Reads see committed rows plus this session's own writes, and return one
+    session-local ORM object per row, as an identity map would. Added objects,
+    inserted rows, deletions and attributes changed on loaded objects reach
+    the store on commit, changed columns only, and are dropped on rollback or
+    close. There are no row locks: a check and the commit after it that run
+    without an await in between cannot interleave with another session.
+    """
+
+    def __init__(self, store: MemoryStore) -> None:
+        self.store = store
+        self.info: dict[str, Any] = {}
+        # Loaded objects with the values they were loaded with (None while new)
+        self._identity: dict[tuple[type[Base], Key], tuple[Base, Row | None]] = {}
+        self._added: list[Base] = []
+        self._merged: set[tuple[type[Base], Key]] = set()
+        self._inserted: dict[type[Base], dict[Key, Row]] = defaultdict(dict)
+        self._deleted: set[tuple[type[Base], Key]] = set()
+        self._held_locks: dict[Hashable, asyncio.Lock] = {}
+
+    async def __aenter__(self) -> "MemorySession":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def add(self, obj: Base) -> None:
+        self._added.append(obj)
+
+    def add_all(self, objs: Iterable[Base]) -> None:
+        self._added.extend(objs)
+
+    async def get(self, model: type[ModelT], ident: Any) -> ModelT | None:
+        self._flush()
+        key = ident if isinstance(ident, tuple) else (ident,)
+        if (model, key) in self._deleted:
+            return None
+        entry = self._identity.get((model, key))
+        if entry is not None:
+            return entry[0]
+        row = self._inserted[model].get(key) or self.store.get(model.__tablename__, key)
+        return None if row is None else self.load(model, row)
+
+    async def merge(self, obj: ModelT) -> ModelT:
+        """Copy `obj` onto the row with its primary key, or add it if there is none."""
+        self._flush()
+        model = type(obj)
+        key = _key(model, _values(obj))
+        existing = await self.get(model, key)
+        if existing is None:
+            self._merged.add((model, key))
+            self.add(obj)
+            return obj
+        for name, value in _values(obj).items():
+            if value is not None:
+                setattr(existing, name, value)
+        return existing
+
+    async def delete(self, obj: Base) -> None:
+        self._deleted.add((type(obj), _key(type(obj), _values(obj))))
+
+    async def flush(self) -> None:
+        self._flush()
+
+    async def refresh(self, obj: Base) -> None:
+        model = type(obj)
+        key = _key(model, _values(obj))
+        row = self._inserted[model].get(key) or self.store.get(model.__tablename__, key)
+        if row is None:
+            raise LookupError(f"{model.__name__} {key} is not committed")
+        for name, value in row.items():
+            setattr(obj, name, value)
+        self._identity[(model, key)] = (obj, dict(row))
+
+    async def commit(self) -> None:
+        self._flush()
+        now = datetime.now(timezone.utc)
+        for model, rows in self._inserted.items():
+            for key, row in rows.items():
+                self.store.insert(model.__tablename__, key, row)
+
+        identity: dict[tuple[type[Base], Key], tuple[Base, Row | None]] = {}
+        for (model, key), (obj, loaded) in self._identity.items():
+            if (model, key) in self._deleted:
+                continue
+            values = _values(obj)
+            if loaded is None:
+                self.store.insert(
+                    model.__tablename__,
+                    key,
+                    dict(values),
+                    replace=(model, key) in self._merged,
+                )
+            else:
+                changes = {k: v for k, v in values.items() if loaded[k] != v}
+                if changes and "updated_at" in values and "updated_at" not in changes:
+                    obj.updated_at = changes["updated_at"] = values["updated_at"] = now
+                if changes:
+                    self.store.update(model.__tablename__, key, changes)
+            identity[(model, key)] = (obj, values)
+        for model, key in self._deleted:
+            self.store.delete(model.__tablename__, key)
+
+        self._identity = identity
+        self._end_transaction()
+        for listener in _listeners["after_commit"]:
+            listener(self)
+
+    async def rollback(self) -> None:
+        self._identity.clear()
+        self._added.clear()
+        self._end_transaction()
+        for listener in _listeners["after_soft_rollback"]:
+            listener(self, None)
+
+    async def close(self) -> None:
+        await self.rollback()
+
+    # Helpers for the memory repositories, beyond the AsyncSession interface
+
+    def scan(
+        self, model: type[Base], column: str | None = None, value: Any = None
+    ) -> list[Row]:
+        """
+        Current rows of `model`: committed ones with this session's writes applied.
+
+        Only rows whose `column` equals `value` are returned when given.
+        """
+        self._flush()
+        found: list[Row] = []
+        seen: set[Key] = set()
+        committed = self.store.rows(model.__tablename__, column, value)
+        inserted = [
+            (key, row)
+            for key, row in self._inserted[model].items()
+            if column is None or row[column] == value
+        ]
+        for key, row in committed + inserted:
+            seen.add(key)
+            if (model, key) in self._deleted:
+                continue
+            entry = self._identity.get((model, key))
+            if entry is not None and entry[1] is not None:
+                obj, loaded = entry
+                row = row | {k: v for k, v in _values(obj).items() if loaded[k] != v}
+            found.append(row)
+        # Objects added in this session and not committed yet
+        for (entry_model, key), (obj, loaded) in self._identity.items():
+            if entry_model is not model or loaded is not None or key in seen:
+                continue
+            if (model, key) in self._deleted:
+                continue
+            row = _values(obj)
+            if column is None or row[column] == value:
+                found.append(row)
+        return found
+
+    def row(self, model: type[Base], ident: Any) -> Row | None:
+        """The current row of `model` with primary key `ident`, as `scan` sees it."""
+        self._flush()
+        key = ident if isinstance(ident, tuple) else (ident,)
+        if (model, key) in self._deleted:
+            return None
+        row = self._inserted[model].get(key) or self.store.get(model.__tablename__, key)
+        entry = self._identity.get((model, key))
+        if entry is None:
+            return row
+        obj, loaded = entry
+        if loaded is None:
+            return _values(obj)
+        if row is None:
+            return None
+        return row | {k: v for k, v in _values(obj).items() if loaded[k] != v}
+
+    def load(self, model: type[ModelT], row: Row) -> ModelT:
+        """Return this session's object for `row`, creating it on first access."""
+        key = _key(model, row)
+        entry = self._identity.get((model, key))
+        if entry is not None:
+            return entry[0]
+        obj = model(**row)
+        self._identity[(model, key)] = (obj, dict(row))
+        return obj
+
+    def insert_rows(self, model: type[Base], rows: list[Row]) -> None:
+        """Insert rows at commit without creating ORM objects for them."""
+        now = datetime.now(timezone.utc)
+        for values in rows:
+            row = with_defaults(model, values, now)
+            self._inserted[model][_key(model, row)] = row
+
+    async def lock(self, names: Iterable[Hashable]) -> None:
+        """Take named locks until the transaction ends, in sorted order."""
+        for name in sorted(set(names)):
+            if name in self._held_locks:
+                continue
+            lock = self.store.lock(name)
+            await lock.acquire()
+            self._held_locks[name] = lock
+
+    def _flush(self) -> None:
+        if not self._added:
+            return
+        now = datetime.now(timezone.utc)
+        for obj in self._added:
+            model = type(obj)
+            row = with_defaults(model, _values(obj), now)
+            for name, value in row.items():
+                if getattr(obj, name) is None and value is not None:
+                    setattr(obj, name, value)
+            self._identity[(model, _key(model, row))] = (obj, None)
+        self._added.clear()
+
+    def _end_transaction(self) -> None:
+        self._merged.clear()
+        self._inserted.clear()
+        self._deleted.clear()
+        for lock in self._held_locks.values():
+            lock.release()
+        self._held_locks.clear()
@@ -0,0 +1,157 @@
+import logging
+import re
+from datetime import date, datetime, timezone
+from typing import Literal
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ExtractionRecord
+
+logger = logging.getLogger(__name__)
+
+# Monthly range partitions of extraction_records (Postgres only), each covering
+# one calendar month of created_at in UTC. The DEFAULT partition catches rows
+# outside every month, so inserts keep working if maintenance falls behind;
+# ensure_partitions moves them into their month once it is created.
+_PARENT = ExtractionRecord.__tablename__
+_DEFAULT_PARTITION = f"{_PARENT}_default"
+_MONTHLY_PARTITION = re.compile(rf"^{_PARENT}_y(\d{{4}})m(\d{{2}})$")
+
+
+def _month_start(now: datetime | None) -> date:
+    now = now or datetime.now(timezone.utc)
+    return date(now.year, now.month, 1)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Return the partition name holding records created in `month`."""
+    return f"{_PARENT}_y{month.year:04d}m{month.month:02d}"
+
+
+async def list_partitions(db: AsyncSession) -> list[str]:
+    """List the partitions currently attached to extraction_records."""
+    stmt = text(
+        """
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = :parent
+        ORDER BY child.relname
+        """
+    )
+    result = await db.execute(stmt, {"parent": _PARENT})
+    return list(result.scalars().all())
+
+
+async def ensure_partitions(
+    months_ahead: int,
+    db: AsyncSession,
+    now: datetime | None = None,
+) -> list[str]:
+    """
+    Create the DEFAULT partition and monthly partitions up to `months_ahead`.
+
+    Covers the current month plus `months_ahead` following months; existing
+    partitions are left alone. Rows of a new month that already landed in
+    the DEFAULT partition are moved into it in the same transaction, since
+    Postgres refuses a partition whose rows the DEFAULT partition holds;
+    inserts routed to the DEFAULT partition wait until that commits.
+    Returns the names of created partitions.
+    """
+    existing = set(await list_partitions(db))
+    created: list[str] = []
+
+    if _DEFAULT_PARTITION not in existing:
+        await db.execute(
+            text(f"CREATE TABLE {_DEFAULT_PARTITION} PARTITION OF {_PARENT} DEFAULT")
+        )
+        created.append(_DEFAULT_PARTITION)
+
+    current = _month_start(now)
+    for offset in range(months_ahead + 1):
+        start = _add_months(current, offset)
+        name = partition_name(start)
+        if name in existing:
+            continue
+        lower = f"'{start.isoformat()} 00:00:00+00'"
+        upper = f"'{_add_months(start, 1).isoformat()} 00:00:00+00'"
+        # Built detached, filled from the DEFAULT partition, then attached;
+        # attaching adds the parent's indexes and foreign keys
+        await db.execute(
+            text(
+                f"CREATE TABLE {name} "
+                f"(LIKE {_PARENT} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        # Block inserts into the DEFAULT partition until commit, so no row of
+        # this month lands there between the move and the attach
+        await db.execute(
+            text(f"LOCK TABLE {_DEFAULT_PARTITION} IN SHARE ROW EXCLUSIVE MODE")
+        )
+        moved = await db.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {_DEFAULT_PARTITION} "
+                f"WHERE created_at >= {lower} AND created_at < {upper} RETURNING *) "
+                f"INSERT INTO {name} SELECT * FROM moved"
+            )
+        )
+        await db.execute(
+            text(
+                f"ALTER TABLE {_PARENT} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ({lower}) TO ({upper})"
+            )
+        )
+        created.append(name)
+        logger.info("Created partition %s", name)
+        if moved.rowcount:
+            logger.warning(
+                "Moved %d records from %s into %s",
+                moved.rowcount,
+                _DEFAULT_PARTITION,
+                name,
+            )
+
+    return created
+
+
+async def apply_retention(
+    retention_months: int,
+    action: Literal["detach", "drop"],
+    db: AsyncSession,
+    now: datetime | None = None,
+) -> list[str]:
+    """
+    Detach or drop monthly partitions older than `retention_months`.
+
+    A partition is removed once its whole month lies before the cutoff (the
+    current month minus `retention_months`). Detached partitions stay
+    behind as standalone tables for archiving. The `total_records` counters
+    of affected extractions are not adjusted. Returns the removed names.
+    """
+    if retention_months <= 0:
+        return []
+
+    cutoff = _add_months(_month_start(now), -retention_months)
+    removed: list[str] = []
+    for name in await list_partitions(db):
+        match = _MONTHLY_PARTITION.match(name)
+        if not match:
+            continue
+        month = date(int(match.group(1)), int(match.group(2)), 1)
+        if _add_months(month, 1) > cutoff:
+            continue
+
+        await db.execute(text(f"ALTER TABLE {_PARENT} DETACH PARTITION {name}"))
+        if action == "drop":
+            await db.execute(text(f"DROP TABLE {name}"))
+        removed.append(name)
+        logger.info("Applied retention to partition %s (%s)", name, action)
+
+    return removed
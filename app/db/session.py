@@ -1,22 +1,151 @@
+import itertools
 from collections.abc import AsyncGenerator
+from functools import partial
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request, Response
+from sqlalchemy import event, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.core.config import get_settings
+from app.db.base import Base
+from app.db.memory import MemorySession, MemoryStore
 
 settings = get_settings()
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.ENV == "local",
-    pool_pre_ping=True,
-)
 
-async_session_factory = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+def _database_url() -> str:
+    """Resolve the connection URL for the configured DATABASE_BACKEND."""
+    if settings.DATABASE_BACKEND == "sqlite":
+        return f"sqlite+aiosqlite:///{settings.SQLITE_PATH}"
+    return settings.DATABASE_URL
+
+
+def _configure_sqlite(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    # ON DELETE CASCADE needs foreign keys; WAL lets readers run beside the writer
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
+def build_engine(
+    url: str,
+    pool_size: int,
+    max_overflow: int,
+    statement_timeout_ms: int,
+) -> AsyncEngine:
+    """Create an engine with the pool and driver tuning from Settings."""
+    connect_args: dict[str, Any] = {}
+    if make_url(url).get_driver_name() == "asyncpg":
+        connect_args["prepared_statement_cache_size"] = settings.DB_STATEMENT_CACHE_SIZE
+        connect_args["statement_cache_size"] = settings.DB_STATEMENT_CACHE_SIZE
+        if statement_timeout_ms:
+            connect_args["server_settings"] = {
+                "statement_timeout": str(statement_timeout_ms)
+            }
+
+    new_engine = create_async_engine(
+        url,
+        echo=settings.DB_ECHO,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+    if new_engine.dialect.name == "sqlite":
+        event.listen(new_engine.sync_engine, "connect", _configure_sqlite)
+    return new_engine
+
+
+if settings.DATABASE_BACKEND == "memory":
+    # No engines: every session works on one store owned by this process
+    memory_store = MemoryStore()
+    engine = worker_engine = None
+    async_session_factory = worker_session_factory = partial(MemorySession, memory_store)
+    replica_engines: list[AsyncEngine] = []
+    _replica_session_factories = itertools.cycle([async_session_factory])
+else:
+    _url = _database_url()
+
+    # Request handlers
+    engine = build_engine(
+        _url,
+        settings.DB_POOL_SIZE,
+        settings.DB_MAX_OVERFLOW,
+        settings.DB_STATEMENT_TIMEOUT_MS,
+    )
+
+    async_session_factory = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+    # Extraction workers (including the embedded worker), so long-running jobs
+    # never hold connections the API needs
+    worker_engine = build_engine(
+        _url,
+        settings.WORKER_DB_POOL_SIZE,
+        settings.WORKER_DB_MAX_OVERFLOW,
+        settings.WORKER_DB_STATEMENT_TIMEOUT_MS,
+    )
+
+    worker_session_factory = async_sessionmaker(
+        worker_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+    # Read-only endpoints, round-robin across replicas
+    replica_engines = [
+        build_engine(
+            url,
+            settings.DB_POOL_SIZE,
+            settings.DB_MAX_OVERFLOW,
+            settings.DB_STATEMENT_TIMEOUT_MS,
+        )
+        for url in settings.DATABASE_REPLICA_URLS
+    ]
+    _replica_session_factories = itertools.cycle(
+        [
+            async_sessionmaker(replica, class_=AsyncSession, expire_on_commit=False)
+            for replica in replica_engines
+        ]
+    )
+
+PRIMARY_PIN_COOKIE = "db_primary_pin"
+
+
+async def init_db() -> None:
+    """
+    Create the schema on SQLite backends.
+
+    Postgres is managed by Alembic migrations and left untouched, and the
+    memory backend needs no schema.
+    """
+    if engine is None or engine.dialect.name != "sqlite":
+        return
+
+    import app.models  # noqa: F401 - registers every table on Base.metadata
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def dispose_engines() -> None:
+    """Close every pooled connection of the API, worker and replica engines."""
+    for each_engine in (engine, worker_engine, *replica_engines):
+        if each_engine is not None:
+            await each_engine.dispose()
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -28,3 +157,36 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+
+
+def pin_to_primary(response: Response) -> None:
+    """
+    Send the client's reads to the primary for READ_YOUR_WRITES_SECONDS.
+
+    Call from endpoints that write, so an immediate follow-up read does not
+    hit a replica that has not replayed the write yet.
+    """
+    if replica_engines:
+        response.set_cookie(
+            PRIMARY_PIN_COOKIE,
+            "1",
+            max_age=settings.READ_YOUR_WRITES_SECONDS,
+            httponly=True,
+            samesite="lax",
+        )
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides a read-only session, on a replica when configured.
+
+    Replicas are used round-robin. Without replicas, or while the client is
+    pinned to the primary by `pin_to_primary`, the session is on the primary.
+    Nothing is committed.
+    """
+    if replica_engines and PRIMARY_PIN_COOKIE not in request.cookies:
+        session_factory = next(_replica_session_factories)
+    else:
+        session_factory = async_session_factory
+    async with session_factory() as session:
+        yield session
@@ -0,0 +1,36 @@
+from functools import lru_cache
+
+from app.core.config import get_settings
+from app.extractors.base import CpuBoundExtractorEngine, ExtractionInput, ExtractorEngine
+from app.extractors.executor import shutdown_process_pool
+from app.extractors.mock import MockChunkedExtractor, MockCpuExtractor, MockExtractor
+
+_ENGINES: dict[str, type[ExtractorEngine]] = {
+    MockExtractor.name: MockExtractor,
+    MockCpuExtractor.name: MockCpuExtractor,
+    MockChunkedExtractor.name: MockChunkedExtractor,
+}
+
+
+@lru_cache
+def get_extractor() -> ExtractorEngine:
+    """Return the extractor engine selected by EXTRACTOR_ENGINE."""
+    engine_name = get_settings().EXTRACTOR_ENGINE
+    try:
+        return _ENGINES[engine_name]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown EXTRACTOR_ENGINE {engine_name!r}, expected one of {sorted(_ENGINES)}"
+        ) from None
+
+
+__all__ = [
+    "CpuBoundExtractorEngine",
+    "ExtractionInput",
+    "ExtractorEngine",
+    "MockChunkedExtractor",
+    "MockCpuExtractor",
+    "MockExtractor",
+    "get_extractor",
+    "shutdown_process_pool",
+]
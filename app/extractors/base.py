@@ -0,0 +1,70 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, ClassVar
+from uuid import UUID
+
+from app.extractors.executor import run_in_process
+
+
+@dataclass(frozen=True)
+class ExtractionInput:
+    """Everything an extractor needs to know about one document (picklable)."""
+
+    document_id: UUID
+    file_path: str
+    content_type: str
+    content_hash: str
+    size_bytes: int
+    # Inclusive 1-based page range when extracting one chunk of a large document
+    page_start: int | None = None
+    page_end: int | None = None
+
+
+class ExtractorEngine(ABC):
+    """
+    Turns one document into a list of extracted record payloads.
+
+    `name` and `version` identify the engine in the result cache; bump the
+    version whenever the output for the same input changes.
+    """
+
+    name: ClassVar[str]
+    version: ClassVar[str]
+
+    @property
+    def cache_key(self) -> str:
+        return f"{self.name}:{self.version}"
+
+    @abstractmethod
+    async def extract(self, document: ExtractionInput) -> list[dict[str, Any]]:
+        """
+        Extract record payloads (JSONB `data` values) from one document.
+
+        When `page_start`/`page_end` are set, only that page range is extracted.
+        """
+
+    async def count_pages(self, document: ExtractionInput) -> int:
+        """
+        Return the document's page count, used to decide whether to chunk it.
+
+        Engines that cannot split documents keep the default of 1, so every
+        document is extracted as a whole.
+        """
+        return 1
+
+
+class CpuBoundExtractorEngine(ExtractorEngine):
+    """
+    Base for engines whose work is CPU-bound, such as PDF or image parsing.
+
+    Subclasses implement the synchronous `extract_sync`, which runs in the
+    extractor process pool so it never blocks the event loop. The engine
+    instance and its input must be picklable.
+    """
+
+    @abstractmethod
+    def extract_sync(self, document: ExtractionInput) -> list[dict[str, Any]]:
+        """Synchronously extract record payloads from one document."""
+
+    async def extract(self, document: ExtractionInput) -> list[dict[str, Any]]:
+        return await run_in_process(self.extract_sync, document)
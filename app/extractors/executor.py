@@ -0,0 +1,50 @@
+import asyncio
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, TypeVar
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Create the shared extractor process pool on first use."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.EXTRACTOR_PROCESS_POOL_SIZE or os.cpu_count()
+        )
+    return _pool
+
+
+async def run_in_process(fn: Callable[..., T], *args: Any) -> T:
+    """
+    Run a CPU-bound callable in the extractor process pool.
+
+    Raises:
+        TimeoutError: If it takes longer than EXTRACTOR_TIMEOUT_SECONDS. The
+            child process keeps running until the call returns, but its
+            result is discarded.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_get_pool(), fn, *args)
+    return await asyncio.wait_for(future, timeout=settings.EXTRACTOR_TIMEOUT_SECONDS)
+
+
+def shutdown_process_pool() -> None:
+    """
+    Shut down the extractor process pool, if it was started.
+
+    Blocks until the worker processes exit; from async code, run it with
+    `asyncio.to_thread`.
+    """
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
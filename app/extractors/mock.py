@@ -0,0 +1,63 @@
+import asyncio
+import math
+import random
+import time
+from typing import Any
+
+from app.core.config import get_settings
+from app.extractors.base import CpuBoundExtractorEngine, ExtractionInput, ExtractorEngine
+
+settings = get_settings()
+
+# Rough page size used by MockChunkedExtractor to estimate page counts
+_MOCK_BYTES_PER_PAGE = 100 * 1024
+
+_MOCK_FIELD_TEMPLATES: list[dict[str, Any]] = [
+    {"field": "doc_type", "value": "invoice", "confidence": 0.92},
+    {"field": "amount", "value": "1500.00", "confidence": 0.87},
+    {"field": "vendor", "value": "Acme Corp", "confidence": 0.95},
+    {"field": "date", "value": "2026-01-15", "confidence": 0.89},
+    {"field": "invoice_number", "value": "INV-2026-001", "confidence": 0.94},
+]
+
+
+def _mock_records() -> list[dict[str, Any]]:
+    """Generate RECORDS_PER_DOCUMENT mock record payloads."""
+    records: list[dict[str, Any]] = []
+    for i in range(settings.RECORDS_PER_DOCUMENT):
+        # Cycle through templates with slight randomization
+        template = _MOCK_FIELD_TEMPLATES[i % len(_MOCK_FIELD_TEMPLATES)].copy()
+        template["confidence"] = round(random.uniform(0.75, 0.99), 2)
+        records.append(template)
+    return records
+
+
+class MockExtractor(ExtractorEngine):
+    """Default engine: simulates a remote AI model with MOCK_AI_DELAY_MS of latency."""
+
+    name = "mock"
+    version = "1"
+
+    async def extract(self, document: ExtractionInput) -> list[dict[str, Any]]:
+        await asyncio.sleep(settings.MOCK_AI_DELAY_MS / 1000.0)
+        return _mock_records()
+
+
+class MockChunkedExtractor(MockExtractor):
+    """Mock engine that reports one page per 100 KiB, to exercise page chunking."""
+
+    name = "mock-chunked"
+
+    async def count_pages(self, document: ExtractionInput) -> int:
+        return max(1, math.ceil(document.size_bytes / _MOCK_BYTES_PER_PAGE))
+
+
+class MockCpuExtractor(CpuBoundExtractorEngine):
+    """Mock engine that blocks for MOCK_AI_DELAY_MS, to exercise the process pool."""
+
+    name = "mock-cpu"
+    version = "1"
+
+    def extract_sync(self, document: ExtractionInput) -> list[dict[str, Any]]:
+        time.sleep(settings.MOCK_AI_DELAY_MS / 1000.0)
+        return _mock_records()
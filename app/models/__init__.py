@@ -1,13 +1,24 @@
 from app.models.document import Document
-from app.models.enums import DocumentStatus, ExtractionStatus
+from app.models.enums import (
+    DocumentStatus,
+    ExtractionChunkStatus,
+    ExtractionDocumentStatus,
+    ExtractionStatus,
+)
 from app.models.extraction import Extraction, ExtractionDocument
+from app.models.extraction_cache_entry import ExtractionCacheEntry
+from app.models.extraction_chunk import ExtractionChunk
 from app.models.extraction_record import ExtractionRecord
 
 __all__ = [
     "Document",
     "DocumentStatus",
     "Extraction",
+    "ExtractionCacheEntry",
+    "ExtractionChunk",
+    "ExtractionChunkStatus",
     "ExtractionDocument",
+    "ExtractionDocumentStatus",
     "ExtractionRecord",
     "ExtractionStatus",
 ]
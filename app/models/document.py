@@ -1,4 +1,4 @@
-from sqlalchemy import BigInteger, Enum, String
+from sqlalchemy import BigInteger, Enum, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin, UUIDMixin
@@ -12,6 +12,7 @@ class Document(Base, UUIDMixin, TimestampMixin):
 
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
     file_path: Mapped[str] = mapped_column(String(512), nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
     content_type: Mapped[str] = mapped_column(String(100), nullable=False)
     size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
     status: Mapped[DocumentStatus] = mapped_column(
@@ -30,6 +31,12 @@ class Document(Base, UUIDMixin, TimestampMixin):
         "ExtractionRecord",
         back_populates="document",
         cascade="all, delete-orphan",
+        # Records are removed by ON DELETE CASCADE, not loaded and deleted one by one
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        Index("ix_documents_content_hash", "content_hash"),
     )
 
 
@@ -15,3 +15,19 @@ class ExtractionStatus(str, enum.Enum):
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
+
+
+class ExtractionDocumentStatus(str, enum.Enum):
+    """Progress of one document within an extraction job."""
+
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ExtractionChunkStatus(str, enum.Enum):
+    """Progress of one page range of a large document."""
+
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
@@ -1,11 +1,11 @@
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import Enum, ForeignKey, Index, UniqueConstraint
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, UniqueConstraint, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin, UUIDMixin
-from app.models.enums import ExtractionStatus
+from app.models.enums import ExtractionDocumentStatus, ExtractionStatus
 
 
 class Extraction(Base, UUIDMixin, TimestampMixin):
@@ -19,6 +19,53 @@ class Extraction(Base, UUIDMixin, TimestampMixin):
         nullable=False,
     )
 
+    # Denormalized counters, maintained on link creation and bulk record writes
+    total_documents: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+    total_records: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+    failed_documents: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+
+    # Job lease: a worker owns a PROCESSING job until lease_expires_at and
+    # extends it with heartbeats; expired leases are re-queued by the reaper
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    heartbeat_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    next_attempt_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    # Fencing token, new on every claim: a worker only renews, writes to or
+    # releases the job while the token it claimed it with is still current
+    lease_token: Mapped[UUID | None] = mapped_column(
+        Uuid(as_uuid=True),
+        nullable=True,
+    )
+
     # Relationships
     extraction_documents: Mapped[list["ExtractionDocument"]] = relationship(
         "ExtractionDocument",
@@ -29,6 +76,13 @@ class Extraction(Base, UUIDMixin, TimestampMixin):
         "ExtractionRecord",
         back_populates="extraction",
         cascade="all, delete-orphan",
+        # Records are removed by ON DELETE CASCADE, not loaded and deleted one by one
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        Index("ix_extractions_status_created_at", "status", "created_at"),
+        Index("ix_extractions_status_lease_expires_at", "status", "lease_expires_at"),
     )
 
 
@@ -38,15 +92,21 @@ class ExtractionDocument(Base, TimestampMixin):
     __tablename__ = "extraction_documents"
 
     extraction_id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True),
+        Uuid(as_uuid=True),
         ForeignKey("extractions.id", ondelete="CASCADE"),
         primary_key=True,
     )
     document_id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True),
+        Uuid(as_uuid=True),
         ForeignKey("documents.id", ondelete="CASCADE"),
         primary_key=True,
     )
+    status: Mapped[ExtractionDocumentStatus] = mapped_column(
+        Enum(ExtractionDocumentStatus),
+        default=ExtractionDocumentStatus.PENDING,
+        nullable=False,
+    )
+    error: Mapped[str | None] = mapped_column(String(1000), nullable=True)
 
     # Relationships
     extraction: Mapped["Extraction"] = relationship(
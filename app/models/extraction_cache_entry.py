@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base, JSONType, TimestampMixin
+
+
+class ExtractionCacheEntry(Base, TimestampMixin):
+    """Caches extracted record data per document content hash and extractor version."""
+
+    __tablename__ = "extraction_cache_entries"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    extractor_version: Mapped[str] = mapped_column(String(100), primary_key=True)
+    records: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSONType,
+        nullable=False,
+        default=list,
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index("ix_extraction_cache_entries_expires_at", "expires_at"),
+    )
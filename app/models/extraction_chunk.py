@@ -0,0 +1,41 @@
+from uuid import UUID
+
+from sqlalchemy import Enum, ForeignKey, Integer, String, UniqueConstraint, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base, TimestampMixin, UUIDMixin
+from app.models.enums import ExtractionChunkStatus
+
+
+class ExtractionChunk(Base, UUIDMixin, TimestampMixin):
+    """A page range of a large document, extracted and committed independently."""
+
+    __tablename__ = "extraction_chunks"
+
+    extraction_id: Mapped[UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("extractions.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    document_id: Mapped[UUID] = mapped_column(
+        Uuid(as_uuid=True),
+        ForeignKey("documents.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    page_start: Mapped[int] = mapped_column(Integer, nullable=False)
+    page_end: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[ExtractionChunkStatus] = mapped_column(
+        Enum(ExtractionChunkStatus),
+        default=ExtractionChunkStatus.PENDING,
+        nullable=False,
+    )
+    error: Mapped[str | None] = mapped_column(String(1000), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "extraction_id",
+            "document_id",
+            "page_start",
+            name="uq_extraction_chunk_pages",
+        ),
+    )
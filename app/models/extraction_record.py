@@ -1,33 +1,55 @@
+from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Index
-from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, PrimaryKeyConstraint, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base, TimestampMixin, UUIDMixin
+from app.db.base import (
+    Base,
+    JSONType,
+    TimestampMixin,
+    UUIDMixin,
+    json_number,
+    json_text,
+    utcnow,
+)
 
 
 class ExtractionRecord(Base, UUIDMixin, TimestampMixin):
-    """Stores extracted JSON results per document per extraction."""
+    """
+    Stores extracted JSON results per document per extraction.
+
+    On Postgres the table is range-partitioned by month on `created_at`
+    (see app.db.partitions), so `created_at` is part of the primary key.
+    """
 
     __tablename__ = "extraction_records"
 
+    # Partition key, so it is part of the primary key
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=utcnow(),
+        primary_key=True,
+    )
     extraction_id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True),
+        Uuid(as_uuid=True),
         ForeignKey("extractions.id", ondelete="CASCADE"),
         nullable=False,
     )
     document_id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True),
+        Uuid(as_uuid=True),
         ForeignKey("documents.id", ondelete="CASCADE"),
         nullable=False,
     )
     data: Mapped[dict[str, Any]] = mapped_column(
-        JSONB,
+        JSONType,
         nullable=False,
         default=dict,
     )
+    # Page provenance, set when the record comes from a chunk of a large document
+    page_start: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    page_end: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     # Relationships
     extraction: Mapped["Extraction"] = relationship(
@@ -40,11 +62,38 @@ class ExtractionRecord(Base, UUIDMixin, TimestampMixin):
     )
 
     __table_args__ = (
-        Index("ix_extraction_records_extraction_id", "extraction_id"),
+        # Keeps id first, so the primary key still serves lookups by id
+        PrimaryKeyConstraint("id", "created_at", name="extraction_records_pkey"),
+        # Serves both extraction_id lookups and stable (created_at, id) keyset pagination
+        Index(
+            "ix_extraction_records_extraction_id_created_at_id",
+            "extraction_id",
+            "created_at",
+            "id",
+        ),
         Index("ix_extraction_records_document_id", "document_id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
 
+# Indexed expressions over the extracted payload, shared by the indexes below and
+# record search so queries use exactly the indexed form. A non-numeric
+# `confidence` is indexed as NULL, so it never matches a confidence range
+RECORD_FIELD = json_text(ExtractionRecord.data, "field")
+RECORD_VALUE = json_text(ExtractionRecord.data, "value")
+RECORD_CONFIDENCE = json_number(ExtractionRecord.data, "confidence")
+
+# Field filter plus (created_at, id) keyset order, and the value/confidence filters
+Index(
+    "ix_extraction_records_field_created_at_id",
+    RECORD_FIELD,
+    ExtractionRecord.created_at,
+    ExtractionRecord.id,
+)
+Index("ix_extraction_records_field_value", RECORD_FIELD, RECORD_VALUE)
+Index("ix_extraction_records_field_confidence", RECORD_FIELD, RECORD_CONFIDENCE)
+
+
 # Import at end to avoid circular imports
 from app.models.document import Document  # noqa: E402, F401
 from app.models.extraction import Extraction  # noqa: E402, F401
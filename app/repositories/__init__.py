@@ -1,7 +1,17 @@
-from app.repositories.document_repository import document_repository
-from app.repositories import extraction_repository
+from app.core.config import get_settings
+
+if get_settings().DATABASE_BACKEND == "memory":
+    from app.repositories.memory import (
+        document_repository,
+        extraction_cache_repository,
+        extraction_repository,
+    )
+else:
+    from app.repositories.document_repository import document_repository
+    from app.repositories import extraction_cache_repository, extraction_repository
 
 __all__ = [
     "document_repository",
+    "extraction_cache_repository",
     "extraction_repository",
 ]
@@ -1,5 +1,5 @@
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import Document
 
@@ -15,6 +15,30 @@ class DocumentRepository:
         db.add(document)
         return document
 
+    async def count_by_content_hash(self, db: AsyncSession, content_hash: str) -> int:
+        stmt = (
+            select(func.count())
+            .select_from(Document)
+            .where(Document.content_hash == content_hash)
+        )
+        result = await db.execute(stmt)
+        return result.scalar() or 0
+
+    async def lock_content_hashes(self, db: AsyncSession, content_hashes: list[str]) -> None:
+        """
+        Lock blobs by content hash until the current transaction ends.
+
+        Takes one transaction-scoped advisory lock per hash, in sorted order so
+        concurrent requests cannot deadlock. Postgres only; other backends run
+        unlocked.
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return
+        for content_hash in sorted(set(content_hashes)):
+            await db.execute(
+                select(func.pg_advisory_xact_lock(func.hashtextextended(content_hash, 0)))
+            )
+
 
 document_repository = DocumentRepository()
 
@@ -0,0 +1,71 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ExtractionCacheEntry
+
+
+async def find_valid(
+    content_hashes: list[str],
+    extractor_version: str,
+    db: AsyncSession,
+) -> list[ExtractionCacheEntry]:
+    """Find unexpired cache entries for the given content hashes."""
+    if not content_hashes:
+        return []
+    stmt = select(ExtractionCacheEntry).where(
+        ExtractionCacheEntry.content_hash.in_(content_hashes),
+        ExtractionCacheEntry.extractor_version == extractor_version,
+        ExtractionCacheEntry.expires_at > func.now(),
+    )
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def upsert_many(
+    entries: dict[str, list[dict[str, Any]]],
+    extractor_version: str,
+    expires_at: datetime,
+    db: AsyncSession,
+) -> None:
+    """Insert or refresh cache entries keyed by content hash."""
+    if not entries:
+        return
+    # Both dialects spell the upsert as INSERT ... ON CONFLICT DO UPDATE
+    dialect = db.get_bind().dialect.name
+    insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+    stmt = insert(ExtractionCacheEntry).values(
+        [
+            {
+                "content_hash": content_hash,
+                "extractor_version": extractor_version,
+                "records": records,
+                "expires_at": expires_at,
+            }
+            for content_hash, records in entries.items()
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[
+            ExtractionCacheEntry.content_hash,
+            ExtractionCacheEntry.extractor_version,
+        ],
+        set_={
+            "records": stmt.excluded.records,
+            "expires_at": stmt.excluded.expires_at,
+            "updated_at": func.now(),
+        },
+    )
+    await db.execute(stmt)
+
+
+async def delete_expired(db: AsyncSession) -> int:
+    """Delete expired cache entries and return how many were removed."""
+    stmt = delete(ExtractionCacheEntry).where(
+        ExtractionCacheEntry.expires_at <= func.now()
+    )
+    result = await db.execute(stmt)
+    return result.rowcount or 0
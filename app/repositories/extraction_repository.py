@@ -1,10 +1,24 @@
-from uuid import UUID
+import json
+from collections import Counter
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID, uuid4
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, insert, or_, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.models import Extraction, ExtractionDocument, ExtractionRecord
+from app.models import (
+    Extraction,
+    ExtractionChunk,
+    ExtractionChunkStatus,
+    ExtractionDocument,
+    ExtractionDocumentStatus,
+    ExtractionRecord,
+    ExtractionStatus,
+)
+from app.models.extraction_record import RECORD_CONFIDENCE, RECORD_FIELD, RECORD_VALUE
 
 
 async def find_by_id(
@@ -17,6 +31,18 @@ async def find_by_id(
     return result.scalar_one_or_none()
 
 
+async def find_by_ids(
+    extraction_ids: list[UUID],
+    db: AsyncSession,
+) -> list[Extraction]:
+    """Find all extractions matching the given IDs in one query."""
+    if not extraction_ids:
+        return []
+    stmt = select(Extraction).where(Extraction.id.in_(extraction_ids))
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
 async def find_by_id_with_documents(
     extraction_id: UUID,
     db: AsyncSession,
@@ -31,6 +57,157 @@ async def find_by_id_with_documents(
     return result.scalar_one_or_none()
 
 
+async def claim_pending(
+    limit: int,
+    now: datetime,
+    lease_expires_at: datetime,
+    db: AsyncSession,
+) -> list[Extraction]:
+    """
+    Claim up to `limit` due PENDING extractions and lease them as PROCESSING.
+
+    Rows are locked with FOR UPDATE SKIP LOCKED, so concurrent workers never
+    claim the same job. Jobs waiting out a retry backoff are skipped until
+    `next_attempt_at`. Every claim gets a fresh `lease_token`. The claim
+    becomes durable when the caller commits.
+    """
+    stmt = (
+        select(Extraction)
+        .where(
+            Extraction.status == ExtractionStatus.PENDING,
+            or_(
+                Extraction.next_attempt_at.is_(None),
+                Extraction.next_attempt_at <= now,
+            ),
+        )
+        .order_by(Extraction.created_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(stmt)
+    extractions = list(result.scalars().all())
+    for extraction in extractions:
+        extraction.status = ExtractionStatus.PROCESSING
+        extraction.attempts += 1
+        extraction.heartbeat_at = now
+        extraction.lease_expires_at = lease_expires_at
+        extraction.lease_token = uuid4()
+        extraction.next_attempt_at = None
+    return extractions
+
+
+async def extend_leases(
+    lease_tokens: list[UUID],
+    now: datetime,
+    lease_expires_at: datetime,
+    db: AsyncSession,
+) -> list[UUID]:
+    """
+    Record a heartbeat for every job still PROCESSING under one of `lease_tokens`.
+
+    Returns the IDs whose lease was extended; a job missing from the result
+    has finished, or was reaped and possibly claimed by another worker.
+    """
+    if not lease_tokens:
+        return []
+    stmt = (
+        update(Extraction)
+        .where(
+            Extraction.lease_token.in_(lease_tokens),
+            Extraction.status == ExtractionStatus.PROCESSING,
+        )
+        .values(heartbeat_at=now, lease_expires_at=lease_expires_at)
+        .returning(Extraction.id)
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def lock_lease(
+    extraction_id: UUID,
+    lease_token: UUID,
+    db: AsyncSession,
+) -> bool:
+    """
+    Lock a job's row if it is still PROCESSING under `lease_token`.
+
+    Called right before a worker commits, so the row lock keeps the reaper
+    from taking the job over until that commit. Returns False if the lease
+    is no longer held.
+    """
+    stmt = (
+        select(Extraction.id)
+        .where(
+            Extraction.id == extraction_id,
+            Extraction.lease_token == lease_token,
+            Extraction.status == ExtractionStatus.PROCESSING,
+        )
+        .with_for_update()
+    )
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none() is not None
+
+
+async def release_processing(
+    lease_tokens: list[UUID],
+    db: AsyncSession,
+) -> list[UUID]:
+    """
+    Put extractions still PROCESSING under `lease_tokens` back to PENDING.
+
+    The interrupted attempt is not charged. Jobs leased to someone else by
+    now are left alone. Returns the IDs that were actually released.
+    """
+    if not lease_tokens:
+        return []
+    stmt = (
+        update(Extraction)
+        .where(
+            Extraction.lease_token.in_(lease_tokens),
+            Extraction.status == ExtractionStatus.PROCESSING,
+        )
+        .values(
+            status=ExtractionStatus.PENDING,
+            attempts=Extraction.attempts - 1,
+            lease_expires_at=None,
+            lease_token=None,
+            next_attempt_at=None,
+        )
+        .returning(Extraction.id)
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def find_expired_leases(
+    now: datetime,
+    limit: int,
+    db: AsyncSession,
+) -> list[Extraction]:
+    """
+    Lock PROCESSING extractions whose lease has expired.
+
+    Jobs without a lease are PROCESSING from before leases existed, and
+    are treated as expired too.
+    """
+    stmt = (
+        select(Extraction)
+        .where(
+            Extraction.status == ExtractionStatus.PROCESSING,
+            or_(
+                Extraction.lease_expires_at.is_(None),
+                Extraction.lease_expires_at < now,
+            ),
+        )
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
 async def create(extraction: Extraction, db: AsyncSession) -> Extraction:
     """Add an extraction to the session."""
     db.add(extraction)
@@ -51,47 +228,317 @@ async def add_document_link(
     return ext_doc
 
 
+async def find_pending_document_ids(
+    extraction_id: UUID,
+    limit: int,
+    db: AsyncSession,
+) -> list[UUID]:
+    """Get up to `limit` document IDs of an extraction that are not processed yet."""
+    stmt = (
+        select(ExtractionDocument.document_id)
+        .where(
+            ExtractionDocument.extraction_id == extraction_id,
+            ExtractionDocument.status == ExtractionDocumentStatus.PENDING,
+        )
+        .order_by(ExtractionDocument.document_id)
+        .limit(limit)
+    )
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def mark_documents(
+    extraction_id: UUID,
+    document_ids: list[UUID],
+    status: ExtractionDocumentStatus,
+    db: AsyncSession,
+) -> None:
+    """Set the processing status of documents within an extraction."""
+    if not document_ids:
+        return
+    stmt = (
+        update(ExtractionDocument)
+        .where(
+            ExtractionDocument.extraction_id == extraction_id,
+            ExtractionDocument.document_id.in_(document_ids),
+        )
+        .values(status=status)
+    )
+    await db.execute(stmt)
+
+
+async def mark_document_failed(
+    extraction_id: UUID,
+    document_id: UUID,
+    error: str,
+    db: AsyncSession,
+) -> None:
+    """Mark one document of an extraction FAILED and record why."""
+    stmt = (
+        update(ExtractionDocument)
+        .where(
+            ExtractionDocument.extraction_id == extraction_id,
+            ExtractionDocument.document_id == document_id,
+        )
+        .values(status=ExtractionDocumentStatus.FAILED, error=error[:1000])
+    )
+    await db.execute(stmt)
+
+
+async def find_chunks(
+    extraction_id: UUID,
+    document_id: UUID,
+    db: AsyncSession,
+) -> list[ExtractionChunk]:
+    """Get the page-range chunks of a document within an extraction."""
+    stmt = (
+        select(ExtractionChunk)
+        .where(
+            ExtractionChunk.extraction_id == extraction_id,
+            ExtractionChunk.document_id == document_id,
+        )
+        .order_by(ExtractionChunk.page_start)
+    )
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def add_chunks(
+    extraction_id: UUID,
+    document_id: UUID,
+    page_ranges: list[tuple[int, int]],
+    db: AsyncSession,
+) -> list[ExtractionChunk]:
+    """Create PENDING chunks for the given inclusive page ranges."""
+    chunks = [
+        ExtractionChunk(
+            extraction_id=extraction_id,
+            document_id=document_id,
+            page_start=page_start,
+            page_end=page_end,
+            status=ExtractionChunkStatus.PENDING,
+        )
+        for page_start, page_end in page_ranges
+    ]
+    db.add_all(chunks)
+    return chunks
+
+
+async def mark_chunk(
+    chunk_id: UUID,
+    status: ExtractionChunkStatus,
+    db: AsyncSession,
+    error: str | None = None,
+) -> None:
+    """Set the processing status of a chunk."""
+    stmt = (
+        update(ExtractionChunk)
+        .where(ExtractionChunk.id == chunk_id)
+        .values(status=status, error=error[:1000] if error else None)
+    )
+    await db.execute(stmt)
+
+
 async def add_record(record: ExtractionRecord, db: AsyncSession) -> ExtractionRecord:
     """Add an extraction record."""
     db.add(record)
     return record
 
 
-async def count_documents(extraction_id: UUID, db: AsyncSession) -> int:
-    """Count documents linked to an extraction."""
+async def bulk_insert_records(rows: list[dict[str, Any]], db: AsyncSession) -> int:
+    """
+    Insert extraction records without ORM unit-of-work bookkeeping.
+
+    Each row needs `extraction_id`, `document_id` and `data`, and may carry
+    `page_start`/`page_end` provenance. The
+    `total_records` counter of every affected extraction is incremented in
+    the same transaction. Uses asyncpg COPY when the session already has an
+    open transaction on an asyncpg connection (so the rows commit or roll
+    back with it), and a Core executemany INSERT otherwise.
+    Returns the number of rows written.
+    """
+    if not rows:
+        return 0
+
+    for extraction_id, count in Counter(row["extraction_id"] for row in rows).items():
+        await increment_total_records(extraction_id, count, db)
+
+    conn = await db.connection()
+    if conn.dialect.driver == "asyncpg":
+        raw_conn = await conn.get_raw_connection()
+        driver_conn = raw_conn.driver_connection
+        if driver_conn.is_in_transaction():
+            await driver_conn.copy_records_to_table(
+                ExtractionRecord.__tablename__,
+                columns=[
+                    "id",
+                    "extraction_id",
+                    "document_id",
+                    "data",
+                    "page_start",
+                    "page_end",
+                ],
+                records=[
+                    (
+                        uuid4(),
+                        row["extraction_id"],
+                        row["document_id"],
+                        json.dumps(row["data"]),
+                        row.get("page_start"),
+                        row.get("page_end"),
+                    )
+                    for row in rows
+                ],
+            )
+            return len(rows)
+
+    await db.execute(
+        insert(ExtractionRecord),
+        [{"id": uuid4(), "page_start": None, "page_end": None, **row} for row in rows],
+    )
+    return len(rows)
+
+
+async def increment_total_records(
+    extraction_id: UUID,
+    count: int,
+    db: AsyncSession,
+) -> None:
+    """Atomically add `count` to an extraction's total_records counter."""
     stmt = (
-        select(func.count())
-        .select_from(ExtractionDocument)
-        .where(ExtractionDocument.extraction_id == extraction_id)
+        update(Extraction)
+        .where(Extraction.id == extraction_id)
+        .values(total_records=Extraction.total_records + count)
+        .execution_options(synchronize_session=False)
     )
-    result = await db.execute(stmt)
-    return result.scalar() or 0
+    await db.execute(stmt)
 
 
-async def count_records(extraction_id: UUID, db: AsyncSession) -> int:
-    """Count records for an extraction."""
+async def increment_failed_documents(
+    extraction_id: UUID,
+    count: int,
+    db: AsyncSession,
+) -> None:
+    """Atomically add `count` to an extraction's failed_documents counter."""
+    stmt = (
+        update(Extraction)
+        .where(Extraction.id == extraction_id)
+        .values(failed_documents=Extraction.failed_documents + count)
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(stmt)
+
+
+async def count_by_status(status: ExtractionStatus, db: AsyncSession) -> int:
+    """Count extractions in the given status."""
     stmt = (
         select(func.count())
-        .select_from(ExtractionRecord)
-        .where(ExtractionRecord.extraction_id == extraction_id)
+        .select_from(Extraction)
+        .where(Extraction.status == status)
     )
     result = await db.execute(stmt)
     return result.scalar() or 0
 
 
+async def count_all_by_status(db: AsyncSession) -> dict[ExtractionStatus, int]:
+    """Count extractions per status in one GROUP BY query."""
+    stmt = select(Extraction.status, func.count()).group_by(Extraction.status)
+    result = await db.execute(stmt)
+    return {status: count for status, count in result.all()}
+
+
 async def find_records_paginated(
     extraction_id: UUID,
     db: AsyncSession,
     limit: int = 100,
     offset: int = 0,
+    after: tuple[datetime, UUID] | None = None,
 ) -> list[ExtractionRecord]:
-    """Get paginated records for an extraction."""
+    """
+    Get paginated records for an extraction in stable (created_at, id) order.
+
+    When `after` is given, records are fetched by keyset from that position,
+    so every page costs the same index seek regardless of depth.
+    """
     stmt = (
         select(ExtractionRecord)
         .where(ExtractionRecord.extraction_id == extraction_id)
-        .order_by(ExtractionRecord.created_at)
+        .order_by(ExtractionRecord.created_at, ExtractionRecord.id)
         .limit(limit)
-        .offset(offset)
     )
+    if after is not None:
+        stmt = stmt.where(
+            tuple_(ExtractionRecord.created_at, ExtractionRecord.id) > tuple_(*after)
+        )
+    elif offset:
+        stmt = stmt.offset(offset)
     result = await db.execute(stmt)
     return list(result.scalars().all())
+
+
+async def search_records(
+    field: str,
+    db: AsyncSession,
+    value: str | None = None,
+    min_confidence: float | None = None,
+    max_confidence: float | None = None,
+    extraction_id: UUID | None = None,
+    limit: int = 100,
+    after: tuple[datetime, UUID] | None = None,
+) -> list[ExtractionRecord]:
+    """
+    Find records of one extracted field across extractions, by keyset.
+
+    Filters on the indexed `data` expressions (field, value, confidence), in
+    stable (created_at, id) order starting after `after` when given.
+    """
+    stmt = (
+        select(ExtractionRecord)
+        .where(RECORD_FIELD == field)
+        .order_by(ExtractionRecord.created_at, ExtractionRecord.id)
+        .limit(limit)
+    )
+    if value is not None:
+        stmt = stmt.where(RECORD_VALUE == value)
+    if min_confidence is not None:
+        stmt = stmt.where(RECORD_CONFIDENCE >= min_confidence)
+    if max_confidence is not None:
+        stmt = stmt.where(RECORD_CONFIDENCE <= max_confidence)
+    if extraction_id is not None:
+        stmt = stmt.where(ExtractionRecord.extraction_id == extraction_id)
+    if after is not None:
+        stmt = stmt.where(
+            tuple_(ExtractionRecord.created_at, ExtractionRecord.id) > tuple_(*after)
+        )
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def stream_record_rows(
+    extraction_id: UUID,
+    db: AsyncSession,
+    batch_size: int = 1000,
+) -> AsyncIterator[Sequence[Row]]:
+    """
+    Stream all records of an extraction through a server-side cursor.
+
+    Yields lightweight (id, document_id, created_at, data, page_start,
+    page_end) rows in batches of `batch_size`, in the same (created_at, id)
+    order as the paginated endpoint, without loading ORM objects.
+    """
+    stmt = (
+        select(
+            ExtractionRecord.id,
+            ExtractionRecord.document_id,
+            ExtractionRecord.created_at,
+            ExtractionRecord.data,
+            ExtractionRecord.page_start,
+            ExtractionRecord.page_end,
+        )
+        .where(ExtractionRecord.extraction_id == extraction_id)
+        .order_by(ExtractionRecord.created_at, ExtractionRecord.id)
+        .execution_options(yield_per=batch_size)
+    )
+    result = await db.stream(stmt)
+    async for partition in result.partitions():
+        yield partition
@@ -0,0 +1,8 @@
+from app.repositories.memory.document_repository import document_repository
+from app.repositories.memory import extraction_cache_repository, extraction_repository
+
+__all__ = [
+    "document_repository",
+    "extraction_cache_repository",
+    "extraction_repository",
+]
@@ -0,0 +1,24 @@
+from uuid import UUID
+
+from app.db.memory import MemorySession
+from app.models import Document
+
+
+class MemoryDocumentRepository:
+    async def find_by_ids(self, db: MemorySession, document_ids: list[UUID]) -> list[Document]:
+        documents = [await db.get(Document, document_id) for document_id in set(document_ids)]
+        return [document for document in documents if document is not None]
+
+    async def create(self, db: MemorySession, document: Document) -> Document:
+        db.add(document)
+        return document
+
+    async def count_by_content_hash(self, db: MemorySession, content_hash: str) -> int:
+        return len(db.scan(Document, "content_hash", content_hash))
+
+    async def lock_content_hashes(self, db: MemorySession, content_hashes: list[str]) -> None:
+        """Lock blobs by content hash until the current transaction ends."""
+        await db.lock(("content_hash", content_hash) for content_hash in content_hashes)
+
+
+document_repository = MemoryDocumentRepository()
@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+from typing import Any
+
+from app.db.memory import MemorySession
+from app.models import ExtractionCacheEntry
+
+
+async def find_valid(
+    content_hashes: list[str],
+    extractor_version: str,
+    db: MemorySession,
+) -> list[ExtractionCacheEntry]:
+    """Find unexpired cache entries for the given content hashes."""
+    now = datetime.now(timezone.utc)
+    entries = [
+        await db.get(ExtractionCacheEntry, (content_hash, extractor_version))
+        for content_hash in content_hashes
+    ]
+    return [entry for entry in entries if entry is not None and entry.expires_at > now]
+
+
+async def upsert_many(
+    entries: dict[str, list[dict[str, Any]]],
+    extractor_version: str,
+    expires_at: datetime,
+    db: MemorySession,
+) -> None:
+    """Insert or refresh cache entries keyed by content hash."""
+    for content_hash, records in entries.items():
+        await db.merge(
+            ExtractionCacheEntry(
+                content_hash=content_hash,
+                extractor_version=extractor_version,
+                records=records,
+                expires_at=expires_at,
+            )
+        )
+
+
+async def delete_expired(db: MemorySession) -> int:
+    """Delete expired cache entries and return how many were removed."""
+    now = datetime.now(timezone.utc)
+    expired = [row for row in db.scan(ExtractionCacheEntry) if row["expires_at"] <= now]
+    for row in expired:
+        await db.delete(db.load(ExtractionCacheEntry, row))
+    return len(expired)
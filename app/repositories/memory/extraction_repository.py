@@ -0,0 +1,447 @@
+import json
+from collections import Counter
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any, NamedTuple
+from uuid import UUID, uuid4
+
+from app.db.memory import MemorySession, Row
+from app.models import (
+    Extraction,
+    ExtractionChunk,
+    ExtractionChunkStatus,
+    ExtractionDocument,
+    ExtractionDocumentStatus,
+    ExtractionRecord,
+    ExtractionStatus,
+)
+
+
+class RecordRow(NamedTuple):
+    """A record as streamed for export, like the SQL repository's result rows."""
+
+    id: UUID
+    document_id: UUID
+    created_at: datetime
+    data: dict[str, Any]
+    page_start: int | None
+    page_end: int | None
+
+
+def _json_text(value: Any) -> str | None:
+    """A JSON member as text, as `->>` renders it."""
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def _json_number(value: Any) -> float | None:
+    """A JSON member as a float, None unless it is a JSON number."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+def _record_order(row: Row) -> tuple[datetime, UUID]:
+    return row["created_at"], row["id"]
+
+
+def _sorted_records(rows: list[Row], after: tuple[datetime, UUID] | None) -> list[Row]:
+    """Rows in stable (created_at, id) order, starting after `after` when given."""
+    if after is not None:
+        rows = [row for row in rows if _record_order(row) > after]
+    return sorted(rows, key=_record_order)
+
+
+async def find_by_id(
+    extraction_id: UUID,
+    db: MemorySession,
+) -> Extraction | None:
+    """Find extraction by ID."""
+    return await db.get(Extraction, extraction_id)
+
+
+async def find_by_ids(
+    extraction_ids: list[UUID],
+    db: MemorySession,
+) -> list[Extraction]:
+    """Find all extractions matching the given IDs."""
+    extractions = [
+        await db.get(Extraction, extraction_id) for extraction_id in set(extraction_ids)
+    ]
+    return [extraction for extraction in extractions if extraction is not None]
+
+
+async def find_by_id_with_documents(
+    extraction_id: UUID,
+    db: MemorySession,
+) -> Extraction | None:
+    """Find extraction by ID with related documents loaded."""
+    extraction = await db.get(Extraction, extraction_id)
+    if extraction is not None:
+        extraction.extraction_documents = [
+            db.load(ExtractionDocument, row)
+            for row in db.scan(ExtractionDocument, "extraction_id", extraction_id)
+        ]
+    return extraction
+
+
+async def claim_pending(
+    limit: int,
+    now: datetime,
+    lease_expires_at: datetime,
+    db: MemorySession,
+) -> list[Extraction]:
+    """
+    Claim up to `limit` due PENDING extractions and lease them as PROCESSING.
+
+    Oldest first, skipping jobs waiting out a retry backoff. Every claim gets
+    a fresh `lease_token`. The claim becomes visible when the caller commits.
+    """
+    due = [
+        row
+        for row in db.scan(Extraction)
+        if row["status"] == ExtractionStatus.PENDING
+        and (row["next_attempt_at"] is None or row["next_attempt_at"] <= now)
+    ]
+    due.sort(key=lambda row: row["created_at"])
+    extractions = [db.load(Extraction, row) for row in due[:limit]]
+    for extraction in extractions:
+        extraction.status = ExtractionStatus.PROCESSING
+        extraction.attempts += 1
+        extraction.heartbeat_at = now
+        extraction.lease_expires_at = lease_expires_at
+        extraction.lease_token = uuid4()
+        extraction.next_attempt_at = None
+    return extractions
+
+
+def _leased(db: MemorySession, lease_tokens: list[UUID]) -> list[Extraction]:
+    """Extractions still PROCESSING under one of `lease_tokens`."""
+    tokens = set(lease_tokens)
+    return [
+        db.load(Extraction, row)
+        for row in db.scan(Extraction)
+        if row["lease_token"] in tokens and row["status"] == ExtractionStatus.PROCESSING
+    ]
+
+
+async def extend_leases(
+    lease_tokens: list[UUID],
+    now: datetime,
+    lease_expires_at: datetime,
+    db: MemorySession,
+) -> list[UUID]:
+    """
+    Record a heartbeat for every job still PROCESSING under one of `lease_tokens`.
+
+    Returns the IDs whose lease was extended; a job missing from the result
+    has finished, or was reaped and possibly claimed by another worker.
+    """
+    extractions = _leased(db, lease_tokens)
+    for extraction in extractions:
+        extraction.heartbeat_at = now
+        extraction.lease_expires_at = lease_expires_at
+    return [extraction.id for extraction in extractions]
+
+
+async def lock_lease(
+    extraction_id: UUID,
+    lease_token: UUID,
+    db: MemorySession,
+) -> bool:
+    """
+    Check that a job is still PROCESSING under `lease_token`.
+
+    Called right before a worker commits; with no await in between, the
+    reaper cannot take the job over before that commit. Returns False if the
+    lease is no longer held.
+    """
+    row = db.row(Extraction, extraction_id)
+    return (
+        row is not None
+        and row["lease_token"] == lease_token
+        and row["status"] == ExtractionStatus.PROCESSING
+    )
+
+
+async def release_processing(
+    lease_tokens: list[UUID],
+    db: MemorySession,
+) -> list[UUID]:
+    """
+    Put extractions still PROCESSING under `lease_tokens` back to PENDING.
+
+    The interrupted attempt is not charged. Jobs leased to someone else by
+    now are left alone. Returns the IDs that were actually released.
+    """
+    extractions = _leased(db, lease_tokens)
+    for extraction in extractions:
+        extraction.status = ExtractionStatus.PENDING
+        extraction.attempts -= 1
+        extraction.lease_expires_at = None
+        extraction.lease_token = None
+        extraction.next_attempt_at = None
+    return [extraction.id for extraction in extractions]
+
+
+async def find_expired_leases(
+    now: datetime,
+    limit: int,
+    db: MemorySession,
+) -> list[Extraction]:
+    """
+    Find PROCESSING extractions whose lease has expired.
+
+    Jobs without a lease are treated as expired too.
+    """
+    expired = [
+        row
+        for row in db.scan(Extraction)
+        if row["status"] == ExtractionStatus.PROCESSING
+        and (row["lease_expires_at"] is None or row["lease_expires_at"] < now)
+    ]
+    return [db.load(Extraction, row) for row in expired[:limit]]
+
+
+async def create(extraction: Extraction, db: MemorySession) -> Extraction:
+    """Add an extraction to the session."""
+    db.add(extraction)
+    return extraction
+
+
+async def add_document_link(
+    extraction_id: UUID,
+    document_id: UUID,
+    db: MemorySession,
+) -> ExtractionDocument:
+    """Link a document to an extraction."""
+    ext_doc = ExtractionDocument(
+        extraction_id=extraction_id,
+        document_id=document_id,
+    )
+    db.add(ext_doc)
+    return ext_doc
+
+
+async def find_pending_document_ids(
+    extraction_id: UUID,
+    limit: int,
+    db: MemorySession,
+) -> list[UUID]:
+    """Get up to `limit` document IDs of an extraction that are not processed yet."""
+    pending = sorted(
+        row["document_id"]
+        for row in db.scan(ExtractionDocument, "extraction_id", extraction_id)
+        if row["status"] == ExtractionDocumentStatus.PENDING
+    )
+    return pending[:limit]
+
+
+async def mark_documents(
+    extraction_id: UUID,
+    document_ids: list[UUID],
+    status: ExtractionDocumentStatus,
+    db: MemorySession,
+) -> None:
+    """Set the processing status of documents within an extraction."""
+    for document_id in document_ids:
+        link = await db.get(ExtractionDocument, (extraction_id, document_id))
+        if link is not None:
+            link.status = status
+
+
+async def mark_document_failed(
+    extraction_id: UUID,
+    document_id: UUID,
+    error: str,
+    db: MemorySession,
+) -> None:
+    """Mark one document of an extraction FAILED and record why."""
+    link = await db.get(ExtractionDocument, (extraction_id, document_id))
+    if link is not None:
+        link.status = ExtractionDocumentStatus.FAILED
+        link.error = error[:1000]
+
+
+async def find_chunks(
+    extraction_id: UUID,
+    document_id: UUID,
+    db: MemorySession,
+) -> list[ExtractionChunk]:
+    """Get the page-range chunks of a document within an extraction."""
+    rows = [
+        row
+        for row in db.scan(ExtractionChunk, "extraction_id", extraction_id)
+        if row["document_id"] == document_id
+    ]
+    rows.sort(key=lambda row: row["page_start"])
+    return [db.load(ExtractionChunk, row) for row in rows]
+
+
+async def add_chunks(
+    extraction_id: UUID,
+    document_id: UUID,
+    page_ranges: list[tuple[int, int]],
+    db: MemorySession,
+) -> list[ExtractionChunk]:
+    """Create PENDING chunks for the given inclusive page ranges."""
+    chunks = [
+        ExtractionChunk(
+            extraction_id=extraction_id,
+            document_id=document_id,
+            page_start=page_start,
+            page_end=page_end,
+            status=ExtractionChunkStatus.PENDING,
+        )
+        for page_start, page_end in page_ranges
+    ]
+    db.add_all(chunks)
+    return chunks
+
+
+async def mark_chunk(
+    chunk_id: UUID,
+    status: ExtractionChunkStatus,
+    db: MemorySession,
+    error: str | None = None,
+) -> None:
+    """Set the processing status of a chunk."""
+    chunk = await db.get(ExtractionChunk, chunk_id)
+    if chunk is not None:
+        chunk.status = status
+        chunk.error = error[:1000] if error else None
+
+
+async def add_record(record: ExtractionRecord, db: MemorySession) -> ExtractionRecord:
+    """Add an extraction record."""
+    db.add(record)
+    return record
+
+
+async def bulk_insert_records(rows: list[dict[str, Any]], db: MemorySession) -> int:
+    """
+    Insert extraction records without creating ORM objects for them.
+
+    Each row needs `extraction_id`, `document_id` and `data`, and may carry
+    `page_start`/`page_end` provenance. The `total_records` counter of every
+    affected extraction is incremented in the same transaction.
+    Returns the number of rows written.
+    """
+    if not rows:
+        return 0
+
+    for extraction_id, count in Counter(row["extraction_id"] for row in rows).items():
+        await increment_total_records(extraction_id, count, db)
+
+    db.insert_rows(ExtractionRecord, [{"id": uuid4(), **row} for row in rows])
+    return len(rows)
+
+
+async def _increment(extraction_id: UUID, column: str, count: int, db: MemorySession) -> None:
+    # Added to the current value, not to a possibly stale loaded object
+    row = db.row(Extraction, extraction_id)
+    if row is not None:
+        setattr(db.load(Extraction, row), column, row[column] + count)
+
+
+async def increment_total_records(
+    extraction_id: UUID,
+    count: int,
+    db: MemorySession,
+) -> None:
+    """Add `count` to an extraction's total_records counter."""
+    await _increment(extraction_id, "total_records", count, db)
+
+
+async def increment_failed_documents(
+    extraction_id: UUID,
+    count: int,
+    db: MemorySession,
+) -> None:
+    """Add `count` to an extraction's failed_documents counter."""
+    await _increment(extraction_id, "failed_documents", count, db)
+
+
+async def count_by_status(status: ExtractionStatus, db: MemorySession) -> int:
+    """Count extractions in the given status."""
+    return sum(row["status"] == status for row in db.scan(Extraction))
+
+
+async def count_all_by_status(db: MemorySession) -> dict[ExtractionStatus, int]:
+    """Count extractions per status."""
+    return dict(Counter(row["status"] for row in db.scan(Extraction)))
+
+
+async def find_records_paginated(
+    extraction_id: UUID,
+    db: MemorySession,
+    limit: int = 100,
+    offset: int = 0,
+    after: tuple[datetime, UUID] | None = None,
+) -> list[ExtractionRecord]:
+    """Get paginated records for an extraction in stable (created_at, id) order."""
+    rows = _sorted_records(db.scan(ExtractionRecord, "extraction_id", extraction_id), after)
+    if after is None and offset:
+        rows = rows[offset:]
+    return [db.load(ExtractionRecord, row) for row in rows[:limit]]
+
+
+async def search_records(
+    field: str,
+    db: MemorySession,
+    value: str | None = None,
+    min_confidence: float | None = None,
+    max_confidence: float | None = None,
+    extraction_id: UUID | None = None,
+    limit: int = 100,
+    after: tuple[datetime, UUID] | None = None,
+) -> list[ExtractionRecord]:
+    """
+    Find records of one extracted field across extractions, by keyset.
+
+    Applies the same field, value and confidence semantics as the indexed
+    SQL expressions: a non-numeric confidence never matches a range.
+    """
+    if extraction_id is not None:
+        rows = db.scan(ExtractionRecord, "extraction_id", extraction_id)
+    else:
+        rows = db.scan(ExtractionRecord)
+
+    def matches(row: Row) -> bool:
+        data = row["data"] or {}
+        if _json_text(data.get("field")) != field:
+            return False
+        if value is not None and _json_text(data.get("value")) != value:
+            return False
+        if min_confidence is None and max_confidence is None:
+            return True
+        confidence = _json_number(data.get("confidence"))
+        return (
+            confidence is not None
+            and (min_confidence is None or confidence >= min_confidence)
+            and (max_confidence is None or confidence <= max_confidence)
+        )
+
+    found = _sorted_records([row for row in rows if matches(row)], after)
+    return [db.load(ExtractionRecord, row) for row in found[:limit]]
+
+
+async def stream_record_rows(
+    extraction_id: UUID,
+    db: MemorySession,
+    batch_size: int = 1000,
+) -> AsyncIterator[Sequence[RecordRow]]:
+    """
+    Stream all records of an extraction in batches of `batch_size`.
+
+    Yields lightweight (id, document_id, created_at, data, page_start,
+    page_end) rows in the same (created_at, id) order as the paginated
+    endpoint, from a snapshot taken when streaming starts.
+    """
+    rows = _sorted_records(db.scan(ExtractionRecord, "extraction_id", extraction_id), None)
+    for start in range(0, len(rows), batch_size):
+        yield [
+            RecordRow(*(row[name] for name in RecordRow._fields))
+            for row in rows[start : start + batch_size]
+        ]
@@ -1,12 +1,28 @@
 from app.schemas.document import DocumentSchema, DocumentsUploadResponse
-from app.schemas.extraction import CreateExtractionRequest, ExtractionCreateResponse
-from app.schemas.extraction_record import ExtractionRecordOut, ExtractionRecordsResponse
+from app.schemas.extraction import (
+    CreateExtractionRequest,
+    ExtractionCreateResponse,
+    ExtractionOut,
+    ExtractionStatusBatchRequest,
+    ExtractionStatusBatchResponse,
+)
+from app.schemas.extraction_record import (
+    ExtractionRecordOut,
+    ExtractionRecordSearchOut,
+    ExtractionRecordSearchResponse,
+    ExtractionRecordsResponse,
+)
 
 __all__ = [
     "DocumentSchema",
     "DocumentsUploadResponse",
     "ExtractionCreateResponse",
     "CreateExtractionRequest",
+    "ExtractionOut",
+    "ExtractionStatusBatchRequest",
+    "ExtractionStatusBatchResponse",
     "ExtractionRecordOut",
     "ExtractionRecordsResponse",
+    "ExtractionRecordSearchOut",
+    "ExtractionRecordSearchResponse",
 ]
@@ -7,6 +7,7 @@ class DocumentSchema(BaseModel):
     id: UUID
     filename: str
     size_bytes: int
+    content_hash: str
   
 class DocumentsUploadResponse(BaseModel):
     documents: list[DocumentSchema]
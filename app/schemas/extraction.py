@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING, Self
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.enums import ExtractionStatus
 
@@ -37,17 +37,38 @@ class ExtractionOut(BaseModel):
     status: ExtractionStatus
     total_documents: int = 0
     total_records: int = 0
+    failed_documents: int = 0
 
     @classmethod
-    def from_extraction(
-        cls,
-        extraction: "Extraction",
-        total_documents: int,
-        total_records: int,
-    ) -> Self:
+    def from_extraction(cls, extraction: "Extraction") -> Self:
         return cls(
             id=extraction.id,
             status=extraction.status,
-            total_documents=total_documents,
-            total_records=total_records,
+            total_documents=extraction.total_documents,
+            total_records=extraction.total_records,
+            failed_documents=extraction.failed_documents,
+        )
+
+
+class ExtractionStatusBatchRequest(BaseModel):
+    """Request schema for POST /extractions/status (batch status lookup)."""
+
+    extraction_ids: list[UUID] = Field(min_length=1, max_length=1000)
+
+
+class ExtractionStatusBatchResponse(BaseModel):
+    """Response schema for POST /extractions/status (batch status lookup)."""
+
+    extractions: list[ExtractionOut]
+    missing_ids: list[UUID] = []
+
+    @classmethod
+    def from_extractions(
+        cls,
+        extractions: list["Extraction"],
+        missing_ids: list[UUID],
+    ) -> Self:
+        return cls(
+            extractions=[ExtractionOut.from_extraction(e) for e in extractions],
+            missing_ids=missing_ids,
         )
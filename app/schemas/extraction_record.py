@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Self
 from uuid import UUID
 
@@ -17,26 +18,56 @@ class ExtractionRecordOut(BaseModel):
     id: UUID
     document_id: UUID
     data: dict[str, Any]
+    page_start: int | None = None
+    page_end: int | None = None
+
+
+class ExtractionRecordSearchOut(ExtractionRecordOut):
+    """Response schema for a record found by search, across extractions."""
+
+    extraction_id: UUID
+    created_at: datetime
+
+
+class ExtractionRecordSearchResponse(BaseModel):
+    """Response schema for a page of record search results."""
+
+    records: list[ExtractionRecordSearchOut] = []
+    next_cursor: str | None = None
+
+    @classmethod
+    def from_records(
+        cls,
+        records: list["ExtractionRecord"],
+        next_cursor: str | None = None,
+    ) -> Self:
+        """Create response from record models."""
+        return cls(
+            records=[ExtractionRecordSearchOut.model_validate(r) for r in records],
+            next_cursor=next_cursor,
+        )
 
 
 class ExtractionRecordsResponse(ExtractionOut):
     """Response schema for extraction with its records."""
 
     records: list[ExtractionRecordOut] = []
+    next_cursor: str | None = None
 
     @classmethod
     def from_extraction(
         cls,
         extraction: "Extraction",
         records: list["ExtractionRecord"],
-        total_documents: int,
-        total_records: int,
+        next_cursor: str | None = None,
     ) -> Self:
         """Create response from extraction model with records."""
         return cls(
             id=extraction.id,
             status=extraction.status,
-            total_documents=total_documents,
-            total_records=total_records,
+            total_documents=extraction.total_documents,
+            total_records=extraction.total_records,
+            failed_documents=extraction.failed_documents,
             records=[ExtractionRecordOut.model_validate(r) for r in records],
+            next_cursor=next_cursor,
         )
@@ -1,6 +1,15 @@
-from app.services import document_service, extraction_service
+from app.services import (
+    document_service,
+    export_service,
+    extraction_service,
+    result_cache,
+    status_events,
+)
 
 __all__ = [
     "document_service",
+    "export_service",
     "extraction_service",
+    "result_cache",
+    "status_events",
 ]
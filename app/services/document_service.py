@@ -1,3 +1,5 @@
+import asyncio
+import hashlib
 import os
 from pathlib import Path
 from uuid import uuid4
@@ -5,15 +7,114 @@ from uuid import uuid4
 from fastapi import UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import metrics
 from app.core.config import get_settings
-from app.core.exceptions import EmptyFilesError, DocumentUploadError
+from app.core.exceptions import (
+    AppException,
+    DocumentTooLargeError,
+    DocumentUploadError,
+    EmptyFilesError,
+)
 from app.models import Document, DocumentStatus
-from app.repositories.document_repository import document_repository
+from app.repositories import document_repository
 from app.schemas.document import DocumentsUploadResponse
 
 settings = get_settings()
 
 
+def _blob_path(storage_dir: Path, content_hash: str) -> Path:
+    """Return the content-addressed location for a blob, fanned out by hash prefix."""
+    return storage_dir / "blobs" / content_hash[:2] / content_hash
+
+
+async def _hash_upload(file: UploadFile) -> tuple[str, int]:
+    """
+    Stream an upload in fixed-size chunks and return its SHA-256 digest and size.
+
+    Only one chunk is held in memory at a time, and hashing runs in a worker
+    thread so large uploads never block the event loop.
+
+    Raises:
+        DocumentTooLargeError: If the upload exceeds MAX_UPLOAD_SIZE_BYTES
+    """
+    filename = file.filename or "unknown"
+    max_bytes = settings.MAX_UPLOAD_SIZE_BYTES
+
+    # The parser has already spooled the file, so this only skips hashing it;
+    # oversized requests are turned away earlier by limit_upload_size
+    if file.size is not None and file.size > max_bytes:
+        raise DocumentTooLargeError(filename, max_bytes)
+
+    hasher = hashlib.sha256()
+    size_bytes = 0
+    while chunk := await file.read(settings.UPLOAD_CHUNK_SIZE_BYTES):
+        size_bytes += len(chunk)
+        if size_bytes > max_bytes:
+            raise DocumentTooLargeError(filename, max_bytes)
+        await asyncio.to_thread(hasher.update, chunk)
+
+    return hasher.hexdigest(), size_bytes
+
+
+async def _store_blob(file: UploadFile, blob_path: Path) -> bool:
+    """
+    Copy an upload to its blob path unless identical content is already stored.
+
+    The file is written under a temporary name and atomically renamed, so
+    concurrent uploads of the same content never observe a partial blob.
+
+    Returns True if a new blob was written.
+    """
+    if await asyncio.to_thread(blob_path.exists):
+        return False
+
+    await asyncio.to_thread(blob_path.parent.mkdir, parents=True, exist_ok=True)
+    tmp_path = blob_path.with_name(f"{blob_path.name}.{uuid4().hex}.part")
+
+    await file.seek(0)
+    out = await asyncio.to_thread(open, tmp_path, "wb")
+    try:
+        while chunk := await file.read(settings.UPLOAD_CHUNK_SIZE_BYTES):
+            await asyncio.to_thread(out.write, chunk)
+        await asyncio.to_thread(out.close)
+        await asyncio.to_thread(os.replace, tmp_path, blob_path)
+    except BaseException:
+        await asyncio.to_thread(out.close)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    return True
+
+
+async def release_blob(content_hash: str, db: AsyncSession) -> bool:
+    """
+    Delete a stored blob once no document references it anymore.
+
+    References are counted under the blob's content-hash lock, which uploads
+    hold from finding or writing the blob until they commit, so a blob is
+    never removed under another upload's uncommitted document. Ends the
+    session's current transaction.
+
+    Returns True if the blob was removed.
+    """
+    try:
+        await document_repository.lock_content_hashes(db, [content_hash])
+        if await document_repository.count_by_content_hash(db, content_hash):
+            return False
+
+        blob_path = _blob_path(Path(settings.STORAGE_DIR), content_hash)
+        try:
+            await asyncio.to_thread(os.remove, blob_path)
+        except FileNotFoundError:
+            return False
+        return True
+    finally:
+        await db.commit()
+
+
 async def upload_documents(files: list[UploadFile], db: AsyncSession) -> DocumentsUploadResponse:
     if not files:
         raise EmptyFilesError()
@@ -22,27 +123,37 @@ async def upload_documents(files: list[UploadFile], db: AsyncSession) -> Documen
     storage_dir.mkdir(parents=True, exist_ok=True)
 
     documents: list[Document] = []
-    created_paths: list[Path] = []
+    created_hashes: list[str] = []
+    original_name = "unknown"
 
     try:
+        hashed: list[tuple[UploadFile, str, int]] = []
         for file in files:
-            doc_id = uuid4()
             original_name = file.filename or "unknown"
-            ext = Path(original_name).suffix
-            file_path = storage_dir / f"{doc_id}{ext}"
+            content_hash, size_bytes = await _hash_upload(file)
+            metrics.DOCUMENT_UPLOAD_SIZE_BYTES.observe(size_bytes)
+            hashed.append((file, content_hash, size_bytes))
 
-            content = await file.read()  
-            with open(file_path, "wb") as f:
-                f.write(content)
+        # Held until commit, so cleanup elsewhere cannot delete a blob we rely on
+        await document_repository.lock_content_hashes(
+            db, [content_hash for _, content_hash, _ in hashed]
+        )
 
-            created_paths.append(file_path)
+        for file, content_hash, size_bytes in hashed:
+            original_name = file.filename or "unknown"
+
+            # Identical bytes are stored once; every Document row points at the shared blob
+            blob_path = _blob_path(storage_dir, content_hash)
+            if await _store_blob(file, blob_path):
+                created_hashes.append(content_hash)
 
             doc = Document(
-                id=doc_id,
+                id=uuid4(),
                 filename=original_name,
-                file_path=str(file_path),
+                file_path=str(blob_path),
+                content_hash=content_hash,
                 content_type=file.content_type or "application/octet-stream",
-                size_bytes=len(content),
+                size_bytes=size_bytes,
                 status=DocumentStatus.UPLOADED,
             )
 
@@ -55,12 +166,13 @@ async def upload_documents(files: list[UploadFile], db: AsyncSession) -> Documen
     except Exception as e:
         await db.rollback()
 
-        # cleanup saved files if something fails
-        for p in created_paths:
+        # cleanup blobs written by this request unless another document uses them
+        for content_hash in created_hashes:
             try:
-                os.remove(p)
+                await release_blob(content_hash, db)
             except Exception:
                 pass
 
+        if isinstance(e, AppException):
+            raise
         raise DocumentUploadError(original_name, str(e))
-
@@ -0,0 +1,147 @@
+import asyncio
+import csv
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.exceptions import ExtractionNotFoundError
+from app.repositories import extraction_repository
+
+settings = get_settings()
+
+EXPORT_FORMATS = ("csv", "parquet")
+
+# Flattened columns written for every record
+EXPORT_COLUMNS = (
+    "record_id",
+    "document_id",
+    "created_at",
+    "field",
+    "value",
+    "confidence",
+    "page_start",
+    "page_end",
+)
+
+
+def _flatten(row: Row) -> dict[str, Any]:
+    """Flatten a record row and its JSONB data into typed export columns."""
+    data = row.data or {}
+    value = data.get("value")
+    confidence = data.get("confidence")
+    # Only real numbers fit the float column; anything else exports as NULL
+    if not isinstance(confidence, (int, float)) or isinstance(confidence, bool):
+        confidence = None
+    return {
+        "record_id": str(row.id),
+        "document_id": str(row.document_id),
+        "created_at": row.created_at,
+        "field": data.get("field"),
+        "value": None if value is None else str(value),
+        "confidence": None if confidence is None else float(confidence),
+        "page_start": row.page_start,
+        "page_end": row.page_end,
+    }
+
+
+def _parquet_schema():
+    """Build the Arrow schema for the export, importing pyarrow lazily."""
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            "Parquet export requires pyarrow; install it with `uv sync --extra parquet`"
+        ) from e
+
+    return pa.schema(
+        [
+            ("record_id", pa.string()),
+            ("document_id", pa.string()),
+            ("created_at", pa.timestamp("us", tz="UTC")),
+            ("field", pa.string()),
+            ("value", pa.string()),
+            ("confidence", pa.float64()),
+            ("page_start", pa.int32()),
+            ("page_end", pa.int32()),
+        ]
+    )
+
+
+async def _write_csv(extraction_id: UUID, output: Path, db: AsyncSession) -> int:
+    written = 0
+    with open(output, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=EXPORT_COLUMNS)
+        writer.writeheader()
+        async for rows in extraction_repository.stream_record_rows(
+            extraction_id, db, batch_size=settings.EXPORT_BATCH_SIZE
+        ):
+            flat = [_flatten(row) for row in rows]
+            await asyncio.to_thread(writer.writerows, flat)
+            written += len(flat)
+    return written
+
+
+async def _write_parquet(extraction_id: UUID, output: Path, db: AsyncSession) -> int:
+    schema = _parquet_schema()
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    row_group_size = settings.EXPORT_PARQUET_ROW_GROUP_SIZE
+    written = 0
+    pending: list[dict[str, Any]] = []
+
+    def flush(writer: pq.ParquetWriter, batch: list[dict[str, Any]]) -> None:
+        writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+
+    writer = pq.ParquetWriter(output, schema)
+    try:
+        async for rows in extraction_repository.stream_record_rows(
+            extraction_id, db, batch_size=settings.EXPORT_BATCH_SIZE
+        ):
+            pending.extend(_flatten(row) for row in rows)
+            if len(pending) >= row_group_size:
+                await asyncio.to_thread(flush, writer, pending)
+                written += len(pending)
+                pending = []
+        if pending:
+            await asyncio.to_thread(flush, writer, pending)
+            written += len(pending)
+    finally:
+        writer.close()
+    return written
+
+
+async def export_records(
+    extraction_id: UUID,
+    output: Path,
+    export_format: str,
+    db: AsyncSession,
+) -> int:
+    """
+    Write all records of an extraction to a CSV or Parquet file.
+
+    Records are read through a server-side cursor and written incrementally
+    (one Parquet row group per EXPORT_PARQUET_ROW_GROUP_SIZE rows), so the
+    job is never materialized in memory. Returns the number of rows written.
+
+    Raises:
+        ExtractionNotFoundError: If extraction not found
+        ValueError: If the format is not supported
+        ImportError: If Parquet is requested but pyarrow is not installed
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format}")
+
+    extraction = await extraction_repository.find_by_id(extraction_id, db)
+
+    if not extraction:
+        raise ExtractionNotFoundError(extraction_id)
+
+    if export_format == "parquet":
+        return await _write_parquet(extraction_id, output, db)
+    return await _write_csv(extraction_id, output, db)
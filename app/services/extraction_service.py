@@ -1,18 +1,59 @@
 import asyncio
-import random
+import json
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core import metrics
 from app.core.config import get_settings
-from app.core.exceptions import DocumentNotFoundError, ExtractionNotFoundError
-from app.db import async_session_factory
-from app.models import Extraction, ExtractionRecord, ExtractionStatus
+from app.core.exceptions import (
+    DocumentNotFoundError,
+    ExtractionLeaseLostError,
+    ExtractionNotFoundError,
+    ExtractionQueueFullError,
+    InvalidConfidenceRangeError,
+)
+from app.core.pagination import decode_cursor, encode_cursor
+from app.db import worker_session_factory
+from app.extractors import ExtractionInput, ExtractorEngine, get_extractor
+from app.models import (
+    Document,
+    Extraction,
+    ExtractionChunk,
+    ExtractionChunkStatus,
+    ExtractionDocumentStatus,
+    ExtractionStatus,
+)
 from app.repositories import document_repository, extraction_repository
-from app.schemas.extraction import ExtractionOut
-from app.schemas.extraction_record import ExtractionRecordsResponse
+from app.schemas.extraction import ExtractionOut, ExtractionStatusBatchResponse
+from app.schemas.extraction_record import (
+    ExtractionRecordSearchResponse,
+    ExtractionRecordsResponse,
+)
+from app.services import result_cache, status_events
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+_TERMINAL_STATUSES = {ExtractionStatus.COMPLETED, ExtractionStatus.FAILED}
+
+
+async def _set_status(
+    extraction: Extraction,
+    status: ExtractionStatus,
+    db: AsyncSession,
+) -> None:
+    """Change an extraction's status and publish the change on commit."""
+    if extraction.status == status:
+        return
+    extraction.status = status
+    await status_events.publish(extraction.id, status, db)
 
 
 async def create_extraction(
@@ -25,8 +66,16 @@ async def create_extraction(
     Returns the Extraction model. The route converts it to ExtractionCreateResponse.
 
     Raises:
+        ExtractionQueueFullError: If MAX_PENDING_EXTRACTIONS jobs are already waiting
         DocumentNotFoundError: If any document IDs are not found
     """
+    if settings.MAX_PENDING_EXTRACTIONS > 0:
+        pending = await extraction_repository.count_by_status(
+            ExtractionStatus.PENDING, db
+        )
+        if pending >= settings.MAX_PENDING_EXTRACTIONS:
+            raise ExtractionQueueFullError(settings.EXTRACTION_RETRY_AFTER_SECONDS)
+
     found_docs = await document_repository.find_by_ids(db, document_ids)
 
     if len(found_docs) != len(document_ids):
@@ -34,7 +83,10 @@ async def create_extraction(
         missing_ids = [doc_id for doc_id in document_ids if doc_id not in found_ids]
         raise DocumentNotFoundError(missing_ids)
 
-    extraction = Extraction(status=ExtractionStatus.PENDING)
+    extraction = Extraction(
+        status=ExtractionStatus.PENDING,
+        total_documents=len(document_ids),
+    )
     await extraction_repository.create(extraction, db)
     await db.flush()
 
@@ -61,14 +113,101 @@ async def get_extraction(
     if not extraction:
         raise ExtractionNotFoundError(extraction_id)
 
-    total_documents = await extraction_repository.count_documents(extraction_id, db)
-    total_records = await extraction_repository.count_records(extraction_id, db)
+    return ExtractionOut.from_extraction(extraction)
 
-    return ExtractionOut.from_extraction(
-        extraction=extraction,
-        total_documents=total_documents,
-        total_records=total_records,
-    )
+
+async def update_job_metrics(db: AsyncSession) -> None:
+    """Refresh the per-status job gauges from the database before a scrape."""
+    counts = await extraction_repository.count_all_by_status(db)
+    for status in ExtractionStatus:
+        metrics.EXTRACTION_JOBS.labels(status=status.value).set(counts.get(status, 0))
+
+
+async def get_extractions_status(
+    extraction_ids: list[UUID],
+    db: AsyncSession,
+) -> ExtractionStatusBatchResponse:
+    """
+    Get status and counts for many extractions with a single query.
+
+    Unknown IDs are reported in `missing_ids` instead of failing the request.
+    """
+    unique_ids = list(dict.fromkeys(extraction_ids))
+    found = await extraction_repository.find_by_ids(unique_ids, db)
+
+    by_id = {extraction.id: extraction for extraction in found}
+    extractions = [by_id[i] for i in unique_ids if i in by_id]
+    missing_ids = [i for i in unique_ids if i not in by_id]
+
+    return ExtractionStatusBatchResponse.from_extractions(extractions, missing_ids)
+
+
+async def wait_for_extraction(
+    extraction_id: UUID,
+    db: AsyncSession,
+    wait_seconds: float,
+) -> ExtractionOut:
+    """
+    Long-poll an extraction until its status changes or `wait_seconds` elapse.
+
+    Returns immediately if the job is already COMPLETED or FAILED.
+
+    Raises:
+        ExtractionNotFoundError: If extraction not found
+    """
+    async with status_events.broadcaster.subscribe(extraction_id) as events:
+        # Read only after subscribing so a change in between is not missed
+        current = await get_extraction(extraction_id, db)
+        if current.status in _TERMINAL_STATUSES:
+            return current
+
+        # Return the connection to the pool while waiting
+        await db.close()
+        try:
+            async with asyncio.timeout(wait_seconds):
+                while await events.get() == current.status:
+                    pass
+        except TimeoutError:
+            return current
+
+    return await get_extraction(extraction_id, db)
+
+
+async def stream_extraction_events(
+    extraction_id: UUID,
+    db: AsyncSession,
+) -> AsyncIterator[str]:
+    """
+    Stream extraction status as Server-Sent Events.
+
+    Emits the current status, then one event per status change, with
+    heartbeat comments in between. The stream ends once the job is
+    COMPLETED or FAILED.
+
+    Raises:
+        ExtractionNotFoundError: If extraction not found
+    """
+    await get_extraction(extraction_id, db)
+    await db.close()
+
+    async def sse_events() -> AsyncIterator[str]:
+        async with status_events.broadcaster.subscribe(extraction_id) as events:
+            while True:
+                current = await get_extraction(extraction_id, db)
+                await db.close()
+                yield f"event: status\ndata: {current.model_dump_json()}\n\n"
+                if current.status in _TERMINAL_STATUSES:
+                    return
+
+                while True:
+                    try:
+                        async with asyncio.timeout(settings.SSE_HEARTBEAT_SECONDS):
+                            if await events.get() != current.status:
+                                break
+                    except TimeoutError:
+                        yield ": keep-alive\n\n"
+
+    return sse_events()
 
 
 async def get_extraction_records(
@@ -76,92 +215,523 @@ async def get_extraction_records(
     db: AsyncSession,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> ExtractionRecordsResponse:
     """
     Get extraction records with pagination.
 
+    Pass the returned `next_cursor` back as `cursor` to fetch the next page;
+    `offset` is only used when no cursor is given.
+
     Raises:
         ExtractionNotFoundError: If extraction not found
+        InvalidCursorError: If the cursor is malformed
     """
+    after = decode_cursor(cursor) if cursor else None
+
     extraction = await extraction_repository.find_by_id(extraction_id, db)
 
     if not extraction:
         raise ExtractionNotFoundError(extraction_id)
 
-    total_documents = await extraction_repository.count_documents(extraction_id, db)
-    total_records = await extraction_repository.count_records(extraction_id, db)
+    # Fetch one extra row to learn whether another page exists
     records = await extraction_repository.find_records_paginated(
-        extraction_id, db, limit=limit, offset=offset
+        extraction_id, db, limit=limit + 1, offset=offset, after=after
     )
+    next_cursor = None
+    if len(records) > limit:
+        records = records[:limit]
+        next_cursor = encode_cursor(records[-1].created_at, records[-1].id)
 
     return ExtractionRecordsResponse.from_extraction(
         extraction=extraction,
         records=records,
-        total_documents=total_documents,
-        total_records=total_records,
+        next_cursor=next_cursor,
     )
 
 
-async def process_extraction(extraction_id: UUID) -> None:
+async def search_records(
+    field: str,
+    db: AsyncSession,
+    value: str | None = None,
+    min_confidence: float | None = None,
+    max_confidence: float | None = None,
+    extraction_id: UUID | None = None,
+    limit: int = 50,
+    cursor: str | None = None,
+) -> ExtractionRecordSearchResponse:
     """
-    Background task to process an extraction job.
+    Search extracted records by field, value and confidence range.
 
-    Creates a NEW DB session (not reusing request db).
-    Simulates AI extraction by generating mock JSONB records for each document.
-    Status transitions: PENDING → PROCESSING → COMPLETED (or FAILED on error).
+    Pass the returned `next_cursor` back as `cursor` to fetch the next page.
+
+    Raises:
+        InvalidConfidenceRangeError: If min_confidence exceeds max_confidence
+        InvalidCursorError: If the cursor is malformed
     """
-    async with async_session_factory() as db:
-        try:
-            extraction = await extraction_repository.find_by_id_with_documents(
-                extraction_id, db
+    if (
+        min_confidence is not None
+        and max_confidence is not None
+        and min_confidence > max_confidence
+    ):
+        raise InvalidConfidenceRangeError(min_confidence, max_confidence)
+    after = decode_cursor(cursor) if cursor else None
+
+    # Fetch one extra row to learn whether another page exists
+    records = await extraction_repository.search_records(
+        field,
+        db,
+        value=value,
+        min_confidence=min_confidence,
+        max_confidence=max_confidence,
+        extraction_id=extraction_id,
+        limit=limit + 1,
+        after=after,
+    )
+    next_cursor = None
+    if len(records) > limit:
+        records = records[:limit]
+        next_cursor = encode_cursor(records[-1].created_at, records[-1].id)
+
+    return ExtractionRecordSearchResponse.from_records(records, next_cursor)
+
+
+async def export_extraction_records(
+    extraction_id: UUID,
+    db: AsyncSession,
+) -> AsyncIterator[str]:
+    """
+    Export all records of an extraction as newline-delimited JSON.
+
+    Returns an async iterator of NDJSON chunks, one per cursor batch, so
+    memory stays constant and the first bytes are sent right away.
+
+    Raises:
+        ExtractionNotFoundError: If extraction not found
+    """
+    extraction = await extraction_repository.find_by_id(extraction_id, db)
+
+    if not extraction:
+        raise ExtractionNotFoundError(extraction_id)
+
+    async def ndjson_chunks() -> AsyncIterator[str]:
+        async for rows in extraction_repository.stream_record_rows(
+            extraction_id, db, batch_size=settings.EXPORT_BATCH_SIZE
+        ):
+            yield "".join(
+                json.dumps(
+                    {
+                        "id": str(row.id),
+                        "document_id": str(row.document_id),
+                        "data": row.data,
+                        "page_start": row.page_start,
+                        "page_end": row.page_end,
+                    }
+                )
+                + "\n"
+                for row in rows
             )
 
-            if not extraction:
-                return
+    return ndjson_chunks()
 
-            # Mark as PROCESSING
-            extraction.status = ExtractionStatus.PROCESSING
-            await db.commit()
 
-            # Simulate AI processing delay
-            delay_seconds = settings.MOCK_AI_DELAY_MS / 1000.0
-            await asyncio.sleep(delay_seconds)
-
-            # Generate mock records per document using configurable count
-            mock_field_templates = [
-                {"field": "doc_type", "value": "invoice", "confidence": 0.92},
-                {"field": "amount", "value": "1500.00", "confidence": 0.87},
-                {"field": "vendor", "value": "Acme Corp", "confidence": 0.95},
-                {"field": "date", "value": "2026-01-15", "confidence": 0.89},
-                {"field": "invoice_number", "value": "INV-2026-001", "confidence": 0.94},
+async def claim_pending_extractions(limit: int) -> dict[UUID, UUID]:
+    """
+    Claim PENDING extraction jobs for this worker.
+
+    Creates a NEW DB session and commits the claim before returning, so the
+    claimed jobs are PROCESSING by the time they are handed to the caller.
+    Returns the lease token of each claimed job, keyed by extraction ID.
+    """
+    now = datetime.now(timezone.utc)
+    lease_expires_at = now + timedelta(seconds=settings.JOB_LEASE_SECONDS)
+    async with worker_session_factory() as db:
+        extractions = await extraction_repository.claim_pending(
+            limit, now, lease_expires_at, db
+        )
+        for extraction in extractions:
+            await status_events.publish(extraction.id, extraction.status, db)
+        await db.commit()
+        return {extraction.id: extraction.lease_token for extraction in extractions}
+
+
+async def renew_leases(leases: dict[UUID, UUID]) -> set[UUID]:
+    """
+    Heartbeat claimed jobs, extending their leases by JOB_LEASE_SECONDS.
+
+    `leases` maps extraction IDs to the lease tokens they were claimed with.
+    Returns the IDs whose lease is still held by these tokens.
+    """
+    now = datetime.now(timezone.utc)
+    lease_expires_at = now + timedelta(seconds=settings.JOB_LEASE_SECONDS)
+    async with worker_session_factory() as db:
+        renewed = await extraction_repository.extend_leases(
+            list(leases.values()), now, lease_expires_at, db
+        )
+        await db.commit()
+        return set(renewed)
+
+
+async def release_extractions(leases: dict[UUID, UUID]) -> int:
+    """
+    Checkpoint unfinished jobs back to PENDING, e.g. when a worker shuts down.
+
+    `leases` maps extraction IDs to the lease tokens they were claimed with;
+    jobs whose lease has moved on to another worker are not touched.
+    Batches committed before the interruption are kept and skipped on the
+    next run; the interrupted run does not count towards JOB_MAX_ATTEMPTS.
+    Returns the number of jobs released.
+    """
+    async with worker_session_factory() as db:
+        released = await extraction_repository.release_processing(
+            list(leases.values()), db
+        )
+        for extraction_id in released:
+            await status_events.publish(extraction_id, ExtractionStatus.PENDING, db)
+        await db.commit()
+        return len(released)
+
+
+async def reap_expired_leases(limit: int = 100) -> int:
+    """
+    Recover PROCESSING jobs whose worker stopped heartbeating.
+
+    Each job goes back to PENDING after an exponential backoff of
+    JOB_RETRY_BACKOFF_SECONDS * 2^(attempts - 1). Jobs that already used
+    JOB_MAX_ATTEMPTS attempts are marked FAILED instead. Documents committed
+    before the crash are skipped when the job runs again.
+    Returns the number of jobs recovered.
+    """
+    now = datetime.now(timezone.utc)
+    async with worker_session_factory() as db:
+        extractions = await extraction_repository.find_expired_leases(now, limit, db)
+        for extraction in extractions:
+            # Revokes the lease: the old worker can no longer write to the job
+            extraction.lease_expires_at = None
+            extraction.lease_token = None
+            if extraction.attempts >= settings.JOB_MAX_ATTEMPTS:
+                logger.warning(
+                    "Extraction %s lost its lease after %d attempts, marking FAILED",
+                    extraction.id,
+                    extraction.attempts,
+                )
+                await _set_status(extraction, ExtractionStatus.FAILED, db)
+                continue
+
+            exponent = max(extraction.attempts - 1, 0)
+            backoff = settings.JOB_RETRY_BACKOFF_SECONDS * 2**exponent
+            extraction.next_attempt_at = now + timedelta(seconds=backoff)
+            logger.warning(
+                "Extraction %s lost its lease, retrying in %ds", extraction.id, backoff
+            )
+            await _set_status(extraction, ExtractionStatus.PENDING, db)
+        await db.commit()
+        return len(extractions)
+
+
+async def _check_lease(extraction_id: UUID, lease_token: UUID, db: AsyncSession) -> None:
+    """
+    Fence the current transaction on the job's lease; call right before commit.
+
+    Raises:
+        ExtractionLeaseLostError: If the job was reaped or claimed by another worker
+    """
+    if not await extraction_repository.lock_lease(extraction_id, lease_token, db):
+        raise ExtractionLeaseLostError(extraction_id)
+
+
+def _extraction_input(document: Document) -> ExtractionInput:
+    return ExtractionInput(
+        document_id=document.id,
+        file_path=document.file_path,
+        content_type=document.content_type,
+        content_hash=document.content_hash,
+        size_bytes=document.size_bytes,
+    )
+
+
+async def _extract_chunked(
+    extraction_id: UUID,
+    lease_token: UUID,
+    document: ExtractionInput,
+    page_count: int,
+    engine: ExtractorEngine,
+    semaphore: asyncio.Semaphore,
+    db: AsyncSession,
+    db_lock: asyncio.Lock,
+) -> None:
+    """
+    Extract a large document as independent page-range chunks.
+
+    Chunk rows are created on first run; chunks that are not COMPLETED yet
+    are extracted in parallel, and each chunk's records are committed
+    together with its status, so a restarted job resumes from the first
+    unfinished chunk instead of page 1. Records carry page provenance.
+
+    Raises:
+        RuntimeError: If any chunk failed; its error is kept on the chunk row
+    """
+    async with db_lock:
+        chunks = await extraction_repository.find_chunks(
+            extraction_id, document.document_id, db
+        )
+        if not chunks:
+            page_ranges = [
+                (start, min(start + settings.CHUNK_PAGES - 1, page_count))
+                for start in range(1, page_count + 1, settings.CHUNK_PAGES)
             ]
+            chunks = await extraction_repository.add_chunks(
+                extraction_id, document.document_id, page_ranges, db
+            )
+        await _check_lease(extraction_id, lease_token, db)
+        await db.commit()
 
-            records: list[ExtractionRecord] = []
-            for ext_doc in extraction.extraction_documents:
-                for i in range(settings.RECORDS_PER_DOCUMENT):
-                    # Cycle through templates with slight randomization
-                    template = mock_field_templates[i % len(mock_field_templates)].copy()
-                    template["confidence"] = round(
-                        random.uniform(0.75, 0.99), 2
-                    )
-                    records.append(
-                        ExtractionRecord(
-                            extraction_id=extraction_id,
-                            document_id=ext_doc.document_id,
-                            data=template,
-                        )
+    async def extract_chunk(chunk: ExtractionChunk) -> None:
+        try:
+            async with semaphore:
+                chunk_input = replace(
+                    document, page_start=chunk.page_start, page_end=chunk.page_end
+                )
+                payloads = await engine.extract(chunk_input)
+        except Exception as e:
+            async with db_lock:
+                await extraction_repository.mark_chunk(
+                    chunk.id, ExtractionChunkStatus.FAILED, db, error=repr(e)
+                )
+                await _check_lease(extraction_id, lease_token, db)
+                await db.commit()
+            raise
+
+        rows = [
+            {
+                "extraction_id": extraction_id,
+                "document_id": document.document_id,
+                "data": data,
+                "page_start": chunk.page_start,
+                "page_end": chunk.page_end,
+            }
+            for data in payloads
+        ]
+        async with db_lock:
+            await extraction_repository.mark_chunk(
+                chunk.id, ExtractionChunkStatus.COMPLETED, db
+            )
+            await extraction_repository.bulk_insert_records(rows, db)
+            await _check_lease(extraction_id, lease_token, db)
+            await db.commit()
+
+    pending = [c for c in chunks if c.status != ExtractionChunkStatus.COMPLETED]
+    outcomes = await asyncio.gather(
+        *(extract_chunk(chunk) for chunk in pending), return_exceptions=True
+    )
+    failed = sum(isinstance(outcome, BaseException) for outcome in outcomes)
+    if failed:
+        raise RuntimeError(f"{failed} of {len(chunks)} page chunks failed")
+
+
+async def _extract_batch(
+    extraction_id: UUID,
+    lease_token: UUID,
+    document_ids: list[UUID],
+    db: AsyncSession,
+) -> tuple[dict[UUID, list[dict[str, Any]]], dict[UUID, str]]:
+    """
+    Produce record payloads for a batch of documents with the configured engine.
+
+    Documents whose content was already extracted by the same engine version
+    are served from the result cache. The rest are extracted concurrently, at
+    most EXTRACTION_DOCUMENT_CONCURRENCY at a time, and a failure only affects
+    the documents sharing that content. Documents with more than
+    CHUNK_PAGE_THRESHOLD pages go through the page-chunk pipeline, which
+    writes their records itself; they are returned with an empty payload list.
+
+    Returns (payloads per succeeded document, error message per failed document).
+    """
+    engine = get_extractor()
+    phase_seconds = metrics.EXTRACTION_PHASE_DURATION_SECONDS
+    # Documents and cached results; the pending-ID query is the caller's "load"
+    with phase_seconds.labels(phase="lookup").time():
+        documents = await document_repository.find_by_ids(db, document_ids)
+        documents_by_hash: dict[str, list[Document]] = defaultdict(list)
+        for document in documents:
+            documents_by_hash[document.content_hash].append(document)
+
+        cached: dict[str, list[dict[str, Any]]] = {}
+        if settings.RESULT_CACHE_ENABLED:
+            cached = await result_cache.get_many(
+                set(documents_by_hash), engine.cache_key, db
+            )
+
+    semaphore = asyncio.Semaphore(settings.EXTRACTION_DOCUMENT_CONCURRENCY)
+    # Chunk commits share the batch session, one at a time
+    db_lock = asyncio.Lock()
+    chunked: set[str] = set()
+
+    async def extract_content(content_hash: str) -> list[dict[str, Any]]:
+        same_content = documents_by_hash[content_hash]
+        document_input = _extraction_input(same_content[0])
+
+        page_count = await engine.count_pages(document_input)
+        if page_count > settings.CHUNK_PAGE_THRESHOLD:
+            chunked.add(content_hash)
+            for document in same_content:
+                await _extract_chunked(
+                    extraction_id,
+                    lease_token,
+                    _extraction_input(document),
+                    page_count,
+                    engine,
+                    semaphore,
+                    db,
+                    db_lock,
+                )
+            return []
+
+        async with semaphore:
+            return await engine.extract(document_input)
+
+    # Identical content is extracted once, even within a batch
+    to_extract = [h for h in documents_by_hash if h not in cached]
+    with phase_seconds.labels(phase="model").time():
+        outcomes = await asyncio.gather(
+            *(extract_content(h) for h in to_extract), return_exceptions=True
+        )
+
+    fresh: dict[str, list[dict[str, Any]]] = {}
+    errors: dict[str, str] = {}
+    for content_hash, outcome in zip(to_extract, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.warning(
+                "Extraction failed for document(s) %s: %r",
+                ", ".join(str(doc.id) for doc in documents_by_hash[content_hash]),
+                outcome,
+            )
+            errors[content_hash] = repr(outcome)
+        else:
+            fresh[content_hash] = outcome
+
+    if settings.RESULT_CACHE_ENABLED:
+        # Chunked results live only in their records, not in the cache
+        cacheable = {h: p for h, p in fresh.items() if h not in chunked}
+        await result_cache.put_many(cacheable, engine.cache_key, db)
+
+    results: dict[UUID, list[dict[str, Any]]] = {}
+    failures: dict[UUID, str] = {}
+    content_hashes = {doc.id: doc.content_hash for doc in documents}
+    for document_id in document_ids:
+        content_hash = content_hashes.get(document_id)
+        if content_hash is None:
+            failures[document_id] = "Document no longer exists"
+        elif content_hash in errors:
+            failures[document_id] = errors[content_hash]
+        else:
+            results[document_id] = (
+                cached[content_hash] if content_hash in cached else fresh[content_hash]
+            )
+
+    return results, failures
+
+
+async def process_extraction(extraction_id: UUID, lease_token: UUID) -> None:
+    """
+    Process an extraction job claimed by an extraction worker.
+
+    Creates a NEW DB session (not reusing request db).
+    Every commit is fenced on `lease_token`, the token the job was claimed
+    with: once the lease is lost to the reaper the run stops without
+    writing anything more, so a job is never processed twice.
+    Runs the configured extractor engine on each document, reusing cached
+    results for documents whose content was extracted before.
+    Documents are processed in batches of EXTRACTION_BATCH_SIZE; each batch's
+    records and document progress are committed together, so memory stays
+    bounded and a restarted job skips documents that already have records.
+    A document that fails to extract is marked FAILED on its own link row.
+    Status transitions: PENDING → PROCESSING → COMPLETED (or FAILED when
+    every document failed or the job itself breaks).
+    """
+    async with worker_session_factory() as db:
+        try:
+            extraction = await extraction_repository.find_by_id(extraction_id, db)
+
+            # Claiming already marked it PROCESSING; skip it if the lease moved on
+            if (
+                not extraction
+                or extraction.status != ExtractionStatus.PROCESSING
+                or extraction.lease_token != lease_token
+            ):
+                logger.warning(
+                    "Extraction %s is no longer leased to this worker, skipping",
+                    extraction_id,
+                )
+                return
+
+            phase_seconds = metrics.EXTRACTION_PHASE_DURATION_SECONDS
+            while True:
+                with phase_seconds.labels(phase="load").time():
+                    document_ids = await extraction_repository.find_pending_document_ids(
+                        extraction_id, settings.EXTRACTION_BATCH_SIZE, db
                     )
+                if not document_ids:
+                    break
 
-            db.add_all(records)
-            extraction.status = ExtractionStatus.COMPLETED
+                results, failures = await _extract_batch(
+                    extraction_id, lease_token, document_ids, db
+                )
+                rows = [
+                    {
+                        "extraction_id": extraction_id,
+                        "document_id": document_id,
+                        "data": data,
+                    }
+                    for document_id, records in results.items()
+                    for data in records
+                ]
+
+                with phase_seconds.labels(phase="insert").time():
+                    await extraction_repository.mark_documents(
+                        extraction_id,
+                        list(results),
+                        ExtractionDocumentStatus.COMPLETED,
+                        db,
+                    )
+                    for document_id, error in failures.items():
+                        await extraction_repository.mark_document_failed(
+                            extraction_id, document_id, error, db
+                        )
+                    if failures:
+                        await extraction_repository.increment_failed_documents(
+                            extraction_id, len(failures), db
+                        )
+                    await extraction_repository.bulk_insert_records(rows, db)
+                with phase_seconds.labels(phase="commit").time():
+                    await _check_lease(extraction_id, lease_token, db)
+                    await db.commit()
+
+            # Fenced before the status change, which ends the lease
+            await _check_lease(extraction_id, lease_token, db)
+            # The job only fails when none of its documents could be extracted
+            await db.refresh(extraction)
+            if extraction.total_documents and (
+                extraction.failed_documents >= extraction.total_documents
+            ):
+                await _set_status(extraction, ExtractionStatus.FAILED, db)
+            else:
+                await _set_status(extraction, ExtractionStatus.COMPLETED, db)
             await db.commit()
 
+        except ExtractionLeaseLostError:
+            # Whoever holds the job now owns its outcome
+            await db.rollback()
+            logger.warning("Extraction %s lost its lease, abandoning run", extraction_id)
+
         except Exception:
-            # Mark FAILED if anything breaks
-            async with async_session_factory() as error_db:
-                extraction = await extraction_repository.find_by_id(
-                    extraction_id, error_db
-                )
-                if extraction:
-                    extraction.status = ExtractionStatus.FAILED
+            # Mark FAILED if anything breaks, unless the job moved on
+            async with worker_session_factory() as error_db:
+                if await extraction_repository.lock_lease(
+                    extraction_id, lease_token, error_db
+                ):
+                    extraction = await extraction_repository.find_by_id(
+                        extraction_id, error_db
+                    )
+                    await _set_status(extraction, ExtractionStatus.FAILED, error_db)
                     await error_db.commit()
@@ -0,0 +1,101 @@
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.repositories import extraction_cache_repository
+
+settings = get_settings()
+
+CachedRecords = list[dict[str, Any]]
+
+
+class LRUCache:
+    """Bounded in-process cache with per-entry expiry and least-recently-used eviction."""
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[str, str], tuple[float, CachedRecords]] = (
+            OrderedDict()
+        )
+
+    def get(self, key: tuple[str, str]) -> CachedRecords | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, records = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return records
+
+    def put(self, key: tuple[str, str], records: CachedRecords, expires_at: float) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (expires_at, records)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_memory = LRUCache(settings.RESULT_CACHE_MEMORY_SIZE)
+
+
+async def get_many(
+    content_hashes: set[str],
+    extractor_version: str,
+    db: AsyncSession,
+) -> dict[str, CachedRecords]:
+    """
+    Look up cached record data for documents by content hash.
+
+    Checks the in-process LRU first and only queries Postgres for the misses,
+    warming the LRU with whatever it finds there.
+    """
+    found: dict[str, CachedRecords] = {}
+    misses: list[str] = []
+    for content_hash in content_hashes:
+        records = _memory.get((content_hash, extractor_version))
+        if records is None:
+            misses.append(content_hash)
+        else:
+            found[content_hash] = records
+
+    entries = await extraction_cache_repository.find_valid(misses, extractor_version, db)
+    for entry in entries:
+        _memory.put(
+            (entry.content_hash, extractor_version),
+            entry.records,
+            entry.expires_at.timestamp(),
+        )
+        found[entry.content_hash] = entry.records
+
+    return found
+
+
+async def put_many(
+    entries: dict[str, CachedRecords],
+    extractor_version: str,
+    db: AsyncSession,
+) -> None:
+    """Store freshly extracted record data in both cache tiers for RESULT_CACHE_TTL_SECONDS."""
+    if not entries:
+        return
+    expires_at = datetime.now(timezone.utc) + timedelta(
+        seconds=settings.RESULT_CACHE_TTL_SECONDS
+    )
+    await extraction_cache_repository.upsert_many(entries, extractor_version, expires_at, db)
+    for content_hash, records in entries.items():
+        _memory.put((content_hash, extractor_version), records, expires_at.timestamp())
+
+
+async def purge_expired(db: AsyncSession) -> int:
+    """Delete expired entries from the persistent tier and return how many were removed."""
+    return await extraction_cache_repository.delete_expired(db)
@@ -0,0 +1,117 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from uuid import UUID
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.db import engine, memory
+from app.models import ExtractionStatus
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+_PENDING_EVENTS_KEY = "pending_status_events"
+
+
+class StatusBroadcaster:
+    """Fans extraction status changes out to subscribers in this process."""
+
+    def __init__(self) -> None:
+        self._subscribers: dict[UUID, set[asyncio.Queue[ExtractionStatus]]] = (
+            defaultdict(set)
+        )
+
+    @asynccontextmanager
+    async def subscribe(
+        self, extraction_id: UUID
+    ) -> AsyncIterator[asyncio.Queue[ExtractionStatus]]:
+        """Receive every status published for an extraction while the context is open."""
+        queue: asyncio.Queue[ExtractionStatus] = asyncio.Queue()
+        self._subscribers[extraction_id].add(queue)
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers[extraction_id]
+            subscribers.discard(queue)
+            if not subscribers:
+                del self._subscribers[extraction_id]
+
+    def publish(self, extraction_id: UUID, status: ExtractionStatus) -> None:
+        for queue in self._subscribers.get(extraction_id, ()):
+            queue.put_nowait(status)
+
+
+broadcaster = StatusBroadcaster()
+
+
+async def publish(extraction_id: UUID, status: ExtractionStatus, db: AsyncSession) -> None:
+    """
+    Publish an extraction status change.
+
+    Call before committing the change. With the "postgres" backend the event is
+    sent with pg_notify inside the transaction, so Postgres delivers it to every
+    API process only once the transaction commits. With the "memory" backend it
+    is handed to the in-process broadcaster after the commit.
+    """
+    if settings.STATUS_EVENTS_BACKEND == "postgres":
+        payload = json.dumps({"id": str(extraction_id), "status": status.value})
+        await db.execute(select(func.pg_notify(settings.STATUS_EVENTS_CHANNEL, payload)))
+    else:
+        db.info.setdefault(_PENDING_EVENTS_KEY, []).append(
+            (extraction_id, status)
+        )
+
+
+@memory.listens_for("after_commit")
+@event.listens_for(Session, "after_commit")
+def _publish_pending_events(session: Session) -> None:
+    for extraction_id, status in session.info.pop(_PENDING_EVENTS_KEY, ()):
+        broadcaster.publish(extraction_id, status)
+
+
+@memory.listens_for("after_soft_rollback")
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_events(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_EVENTS_KEY, None)
+
+
+def _on_notify(connection, pid: int, channel: str, payload: str) -> None:
+    try:
+        message = json.loads(payload)
+        broadcaster.publish(UUID(message["id"]), ExtractionStatus(message["status"]))
+    except (ValueError, KeyError):
+        logger.warning("Ignoring malformed status event: %s", payload)
+
+
+async def run_listener() -> None:
+    """
+    Relay Postgres NOTIFY status events to the in-process broadcaster.
+
+    Holds one dedicated connection and reconnects if it drops. Runs until cancelled.
+    """
+    while True:
+        try:
+            async with engine.connect() as conn:
+                raw_conn = await conn.get_raw_connection()
+                driver_conn = raw_conn.driver_connection
+                await driver_conn.add_listener(settings.STATUS_EVENTS_CHANNEL, _on_notify)
+                try:
+                    while not driver_conn.is_closed():
+                        await asyncio.sleep(settings.SSE_HEARTBEAT_SECONDS)
+                finally:
+                    if not driver_conn.is_closed():
+                        await driver_conn.remove_listener(
+                            settings.STATUS_EVENTS_CHANNEL, _on_notify
+                        )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Status event listener failed, reconnecting")
+        await asyncio.sleep(1)
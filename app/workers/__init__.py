@@ -0,0 +1,3 @@
+from app.workers.extraction_worker import run_worker
+
+__all__ = ["run_worker"]
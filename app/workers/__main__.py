@@ -0,0 +1,42 @@
+import asyncio
+import logging
+import signal
+
+from prometheus_client import start_http_server
+
+from app.core.config import get_settings
+from app.core.metrics import register_pool_metrics
+from app.db import dispose_engines, init_db, worker_engine
+from app.extractors import shutdown_process_pool
+from app.workers import run_worker
+
+settings = get_settings()
+
+
+async def main() -> None:
+    if settings.DATABASE_BACKEND == "memory":
+        raise SystemExit(
+            "DATABASE_BACKEND=memory keeps jobs inside the API process; "
+            "use EMBEDDED_WORKER=true instead of a separate worker"
+        )
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    if settings.WORKER_METRICS_PORT:
+        register_pool_metrics({"worker": worker_engine})
+        start_http_server(settings.WORKER_METRICS_PORT)
+
+    try:
+        await init_db()
+        await run_worker(stop_event)
+    finally:
+        await asyncio.to_thread(shutdown_process_pool)
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=settings.LOG_LEVEL)
+    asyncio.run(main())
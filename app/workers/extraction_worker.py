@@ -0,0 +1,210 @@
+import asyncio
+import logging
+from uuid import UUID
+
+from app.core import metrics
+from app.core.config import get_settings
+from app.services import extraction_service
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+async def _heartbeat(
+    leases: dict[UUID, UUID],
+    running: dict[UUID, asyncio.Task],
+) -> None:
+    """
+    Keep extending the leases of every claimed job, queued or running, until cancelled.
+
+    A job whose lease was lost (reaped, and possibly claimed by another
+    worker) is dropped: removed from `leases` so a consumer skips it, and
+    cancelled if it is already running.
+    """
+    while True:
+        await asyncio.sleep(settings.JOB_HEARTBEAT_SECONDS)
+        held = dict(leases)
+        if not held:
+            continue
+        try:
+            renewed = await extraction_service.renew_leases(held)
+        except Exception:
+            logger.exception("Failed to renew leases of %d extractions", len(held))
+            continue
+
+        for extraction_id, lease_token in held.items():
+            # Finished (or finishing) jobs are no longer in `leases`
+            if extraction_id in renewed or leases.get(extraction_id) != lease_token:
+                continue
+            logger.warning("Lost lease of extraction %s, abandoning it", extraction_id)
+            del leases[extraction_id]
+            task = running.get(extraction_id)
+            if task is not None:
+                task.cancel()
+
+
+async def _consume(
+    queue: asyncio.Queue[UUID],
+    leases: dict[UUID, UUID],
+    running: dict[UUID, asyncio.Task],
+) -> None:
+    """Process claimed extraction jobs from the in-memory queue, one at a time."""
+    while True:
+        extraction_id = await queue.get()
+        metrics.WORKER_QUEUE_DEPTH.set(queue.qsize())
+        lease_token = leases.get(extraction_id)
+        if lease_token is None:
+            # Lease lost while queued; the job is someone else's now
+            queue.task_done()
+            continue
+
+        logger.info("Processing extraction %s", extraction_id)
+        task = asyncio.create_task(
+            extraction_service.process_extraction(extraction_id, lease_token)
+        )
+        running[extraction_id] = task
+        metrics.WORKER_JOBS_IN_FLIGHT.set(len(running))
+        try:
+            await task
+        except asyncio.CancelledError:
+            # Shutdown cancels the consumer itself; a lost lease only the job
+            if asyncio.current_task().cancelling():
+                raise
+        except Exception:
+            logger.exception("Extraction %s crashed", extraction_id)
+        finally:
+            del running[extraction_id]
+            leases.pop(extraction_id, None)
+            metrics.WORKER_JOBS_IN_FLIGHT.set(len(running))
+            queue.task_done()
+
+
+async def _drain(
+    queue: asyncio.Queue[UUID],
+    leases: dict[UUID, UUID],
+    running: dict[UUID, asyncio.Task],
+) -> None:
+    """
+    Hand queued jobs back right away and give running ones the drain deadline.
+
+    Queued jobs are taken off the queue before a consumer can start them and
+    released to PENDING at once, so only jobs already running delay shutdown.
+    """
+    queued: dict[UUID, UUID] = {}
+    while not queue.empty():
+        extraction_id = queue.get_nowait()
+        queue.task_done()
+        if extraction_id in leases:
+            queued[extraction_id] = leases[extraction_id]
+    metrics.WORKER_QUEUE_DEPTH.set(0)
+
+    if queued:
+        released = await extraction_service.release_extractions(queued)
+        for extraction_id in queued:
+            leases.pop(extraction_id, None)
+        logger.info("Released %d queued extractions back to PENDING", released)
+
+    if not running:
+        return
+    logger.info("Draining %d running extractions", len(running))
+    _, pending = await asyncio.wait(
+        list(running.values()), timeout=settings.WORKER_DRAIN_TIMEOUT_SECONDS
+    )
+    if pending:
+        logger.warning("Drain deadline reached, checkpointing unfinished jobs")
+
+
+async def _reap(stop_event: asyncio.Event) -> None:
+    """Periodically re-queue jobs whose worker died, until `stop_event` is set."""
+    while not stop_event.is_set():
+        try:
+            reaped = await extraction_service.reap_expired_leases()
+            if reaped:
+                logger.info("Recovered %d extractions with expired leases", reaped)
+        except Exception:
+            logger.exception("Failed to reap expired leases")
+        try:
+            await asyncio.wait_for(
+                stop_event.wait(), timeout=settings.REAPER_INTERVAL_SECONDS
+            )
+        except TimeoutError:
+            pass
+
+
+async def run_worker(stop_event: asyncio.Event | None = None) -> None:
+    """
+    Poll the extractions table for PENDING jobs and process them.
+
+    Jobs are claimed with SELECT ... FOR UPDATE SKIP LOCKED, so any number of
+    workers can run side by side on one or more nodes. Claimed jobs, queued
+    or running, are kept leased with heartbeats, and every worker also reaps
+    jobs whose lease expired because their worker died. A job whose lease
+    this worker lost anyway is cancelled, and its writes are fenced by the
+    lease token, so it is never processed twice.
+
+    WORKER_CONCURRENCY consumers pull from a queue bounded by WORKER_QUEUE_SIZE,
+    and the poller only claims as many jobs as the queue has free slots. Work
+    that this worker cannot start soon stays PENDING for other workers, and
+    DB sessions in use stay at one per consumer plus one each for the poller,
+    the heartbeat and the reaper.
+
+    Runs until `stop_event` is set. It then stops claiming, releases jobs
+    still queued back to PENDING, and waits up to WORKER_DRAIN_TIMEOUT_SECONDS
+    for running jobs; whatever is still unfinished is cancelled and
+    checkpointed back to PENDING.
+    """
+    stop_event = stop_event or asyncio.Event()
+    poll_interval = settings.WORKER_POLL_INTERVAL_MS / 1000.0
+    queue: asyncio.Queue[UUID] = asyncio.Queue(maxsize=settings.WORKER_QUEUE_SIZE)
+    # Lease token of every claimed, unfinished job, and the jobs running now
+    leases: dict[UUID, UUID] = {}
+    running: dict[UUID, asyncio.Task] = {}
+    consumers = [
+        asyncio.create_task(_consume(queue, leases, running))
+        for _ in range(settings.WORKER_CONCURRENCY)
+    ]
+    heartbeat = asyncio.create_task(_heartbeat(leases, running))
+    reaper = asyncio.create_task(_reap(stop_event))
+
+    logger.info(
+        "Extraction worker started with concurrency %d", settings.WORKER_CONCURRENCY
+    )
+    try:
+        while not stop_event.is_set():
+            free_slots = queue.maxsize - queue.qsize()
+            claimed: dict[UUID, UUID] = {}
+
+            if free_slots > 0:
+                try:
+                    claimed = await extraction_service.claim_pending_extractions(
+                        min(free_slots, settings.WORKER_BATCH_SIZE)
+                    )
+                except Exception:
+                    logger.exception("Failed to claim pending extractions")
+
+            if not claimed:
+                # Idle or saturated: wait for the next poll or an early stop
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=poll_interval)
+                except TimeoutError:
+                    pass
+                continue
+
+            leases.update(claimed)
+            for extraction_id in claimed:
+                await queue.put(extraction_id)
+            metrics.WORKER_QUEUE_DEPTH.set(queue.qsize())
+
+        await _drain(queue, leases, running)
+    finally:
+        unfinished = dict(leases)
+
+        for task in (*consumers, heartbeat, reaper):
+            task.cancel()
+        await asyncio.gather(*consumers, heartbeat, reaper, return_exceptions=True)
+
+        if unfinished:
+            released = await extraction_service.release_extractions(unfinished)
+            logger.info("Released %d unfinished extractions back to PENDING", released)
+
+    logger.info("Extraction worker stopped")
@@ -0,0 +1,117 @@
+"""
+Benchmark extraction record inserts: ORM add_all vs Core executemany vs COPY.
+
+Runs against DATABASE_URL. Every strategy writes into a throwaway document and
+extraction inside a transaction that is rolled back, so the database is left
+unchanged.
+
+Usage:
+    uv run python -m benchmarks.bench_record_insert --records 100000 --repeat 3
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import async_session_factory, engine
+from app.models import (
+    Document,
+    DocumentStatus,
+    Extraction,
+    ExtractionRecord,
+    ExtractionStatus,
+)
+from app.repositories import extraction_repository
+
+
+def _make_rows(extraction_id: UUID, document_id: UUID, count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "extraction_id": extraction_id,
+            "document_id": document_id,
+            "data": {
+                "field": "amount",
+                "value": "1500.00",
+                "confidence": round(random.uniform(0.75, 0.99), 2),
+            },
+        }
+        for _ in range(count)
+    ]
+
+
+async def _insert_orm(rows: list[dict[str, Any]], db: AsyncSession) -> None:
+    db.add_all([ExtractionRecord(**row) for row in rows])
+    await db.flush()
+
+
+async def _insert_executemany(rows: list[dict[str, Any]], db: AsyncSession) -> None:
+    await db.execute(insert(ExtractionRecord), [{"id": uuid4(), **row} for row in rows])
+
+
+async def _insert_bulk(rows: list[dict[str, Any]], db: AsyncSession) -> None:
+    await extraction_repository.bulk_insert_records(rows, db)
+
+
+STRATEGIES: dict[str, Callable[[list[dict[str, Any]], AsyncSession], Awaitable[None]]] = {
+    "orm_add_all": _insert_orm,
+    "core_executemany": _insert_executemany,
+    "bulk_insert_records": _insert_bulk,
+}
+
+
+async def _run_once(strategy: str, record_count: int) -> float:
+    """Insert `record_count` records with one strategy and return records per second."""
+    async with async_session_factory() as db:
+        try:
+            document = Document(
+                filename="bench.pdf",
+                file_path="bench.pdf",
+                content_hash="0" * 64,
+                content_type="application/pdf",
+                size_bytes=0,
+                status=DocumentStatus.UPLOADED,
+            )
+            extraction = Extraction(status=ExtractionStatus.PROCESSING)
+            db.add_all([document, extraction])
+            await db.flush()
+
+            rows = _make_rows(extraction.id, document.id, record_count)
+            started = time.perf_counter()
+            await STRATEGIES[strategy](rows, db)
+            elapsed = time.perf_counter() - started
+        finally:
+            await db.rollback()
+
+    return record_count / elapsed
+
+
+async def main(record_count: int, repeat: int) -> None:
+    results: dict[str, dict[str, float]] = {}
+    try:
+        for strategy in STRATEGIES:
+            rates = [await _run_once(strategy, record_count) for _ in range(repeat)]
+            results[strategy] = {
+                "records": record_count,
+                "best_records_per_second": round(max(rates), 1),
+                "mean_records_per_second": round(sum(rates) / len(rates), 1),
+            }
+    finally:
+        await engine.dispose()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.records, args.repeat))
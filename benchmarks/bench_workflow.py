@@ -0,0 +1,253 @@
+"""
+Benchmark the upload -> create extraction -> poll -> fetch records workflow.
+
+Drives the FastAPI app in-process through httpx's ASGI transport with an
+extraction worker running in the same event loop, so neither a server nor
+Postgres is needed: by default the database is a throwaway SQLite file
+created from the models. Pass --database-url to run against a migrated
+Postgres instead, or --memory to use the in-memory repositories and measure
+the services without any database latency.
+
+Reports throughput and p50/p95/p99 latency per stage as JSON:
+    upload_documents        POST /documents
+    create_extraction       POST /extractions
+    process_extraction      worker time per job
+    extraction_turnaround   POST /extractions until a poller sees the job finish
+    find_records_paginated  one GET /extractions/{id}/records page
+
+Usage:
+    uv run --extra bench python -m benchmarks.bench_workflow \\
+        --workflows 200 --concurrency 16 --documents 5
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import tempfile
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+_TERMINAL_STATUSES = ("completed", "failed")
+
+
+def _configure_environment(args: argparse.Namespace, work_dir: Path) -> None:
+    """
+    Point the app's settings at the benchmark database and storage.
+
+    Must run before anything under `app` is imported, since settings and the
+    engine are created at import time.
+    """
+    os.environ.update(
+        {
+            "DATABASE_BACKEND": (
+                "postgres" if args.database_url else "memory" if args.memory else "sqlite"
+            ),
+            "DATABASE_URL": args.database_url or "",
+            "SQLITE_PATH": str(work_dir / "bench.db"),
+            "STORAGE_DIR": str(work_dir / "storage"),
+            # The worker runs in this process, so status events stay in memory
+            "STATUS_EVENTS_BACKEND": "memory",
+            "ENV": "benchmark",
+            # Keep SQL echo out of the measurements, whatever .env says
+            "DB_ECHO": "false",
+            "MOCK_AI_DELAY_MS": str(args.mock_delay_ms),
+            "RECORDS_PER_DOCUMENT": str(args.records_per_document),
+            "WORKER_POLL_INTERVAL_MS": str(args.poll_interval_ms),
+            "WORKER_CONCURRENCY": str(args.worker_concurrency),
+            "WORKER_QUEUE_SIZE": str(args.worker_concurrency),
+        }
+    )
+    for name in ("APP_NAME", "APP_DESCRIPTION", "LOG_LEVEL"):
+        os.environ.setdefault(name, "benchmark" if name != "LOG_LEVEL" else "WARNING")
+
+
+def _summarize(samples: list[float]) -> dict[str, float]:
+    """Summarize latencies (seconds) as milliseconds with nearest-rank percentiles."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {"count": 0}
+
+    def percentile(p: float) -> float:
+        rank = max(math.ceil(p / 100 * len(ordered)), 1)
+        return round(ordered[rank - 1] * 1000, 3)
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+        "p50_ms": percentile(50),
+        "p95_ms": percentile(95),
+        "p99_ms": percentile(99),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def _timed(
+    fn: Callable[..., Awaitable[Any]],
+    samples: list[float],
+) -> Callable[..., Awaitable[Any]]:
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return await fn(*args, **kwargs)
+        finally:
+            samples.append(time.perf_counter() - started)
+
+    return wrapper
+
+
+async def _workflow(
+    client: httpx.AsyncClient,
+    args: argparse.Namespace,
+    samples: dict[str, list[float]],
+) -> int:
+    """Run one upload -> extract -> poll -> fetch cycle and return records fetched."""
+    files = [
+        ("files", (f"bench-{i}.pdf", os.urandom(args.document_size), "application/pdf"))
+        for i in range(args.documents)
+    ]
+    started = time.perf_counter()
+    response = await client.post("/documents", files=files)
+    response.raise_for_status()
+    samples["upload_documents"].append(time.perf_counter() - started)
+    document_ids = [document["id"] for document in response.json()["documents"]]
+
+    started = time.perf_counter()
+    response = await client.post("/extractions", json={"document_ids": document_ids})
+    response.raise_for_status()
+    samples["create_extraction"].append(time.perf_counter() - started)
+    extraction_id = response.json()["extraction_id"]
+
+    status = response.json()["status"]
+    while status not in _TERMINAL_STATUSES:
+        response = await client.get(
+            f"/extractions/{extraction_id}", params={"wait": args.poll_wait_seconds}
+        )
+        response.raise_for_status()
+        status = response.json()["status"]
+    samples["extraction_turnaround"].append(time.perf_counter() - started)
+    if status != "completed":
+        raise RuntimeError(f"Extraction {extraction_id} ended as {status}")
+
+    fetched = 0
+    cursor: str | None = None
+    while True:
+        params: dict[str, Any] = {"limit": args.page_size}
+        if cursor:
+            params["cursor"] = cursor
+        started = time.perf_counter()
+        response = await client.get(f"/extractions/{extraction_id}/records", params=params)
+        response.raise_for_status()
+        samples["find_records_paginated"].append(time.perf_counter() - started)
+        page = response.json()
+        fetched += len(page["records"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            return fetched
+
+
+async def main(args: argparse.Namespace) -> dict[str, Any]:
+    # Imported here so _configure_environment() takes effect first
+    from app.core.config import get_settings
+    from app.db import dispose_engines, init_db
+    from app.extractors import shutdown_process_pool
+    from app.services import extraction_service
+    from app.workers import run_worker
+    from main import app
+
+    samples: dict[str, list[float]] = defaultdict(list)
+    extraction_service.process_extraction = _timed(
+        extraction_service.process_extraction, samples["process_extraction"]
+    )
+
+    await init_db()
+
+    stop_event = asyncio.Event()
+    worker = asyncio.create_task(run_worker(stop_event))
+    semaphore = asyncio.Semaphore(args.concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async def bounded(client: httpx.AsyncClient) -> int:
+        async with semaphore:
+            return await _workflow(client, args, samples)
+
+    try:
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=None
+        ) as client:
+            started = time.perf_counter()
+            outcomes = await asyncio.gather(
+                *(bounded(client) for _ in range(args.workflows)),
+                return_exceptions=True,
+            )
+            elapsed = time.perf_counter() - started
+    finally:
+        stop_event.set()
+        await worker
+        await asyncio.to_thread(shutdown_process_pool)
+        await dispose_engines()
+
+    errors = [repr(o) for o in outcomes if isinstance(o, BaseException)]
+    succeeded = len(outcomes) - len(errors)
+    records = sum(o for o in outcomes if not isinstance(o, BaseException))
+    return {
+        "config": {
+            "database": get_settings().DATABASE_BACKEND,
+            "workflows": args.workflows,
+            "concurrency": args.concurrency,
+            "documents_per_workflow": args.documents,
+            "document_size_bytes": args.document_size,
+            "records_per_document": args.records_per_document,
+            "worker_concurrency": args.worker_concurrency,
+            "mock_delay_ms": args.mock_delay_ms,
+        },
+        "duration_seconds": round(elapsed, 3),
+        "throughput": {
+            "workflows_per_second": round(succeeded / elapsed, 3),
+            "documents_per_second": round(succeeded * args.documents / elapsed, 3),
+            "records_per_second": round(records / elapsed, 3),
+        },
+        "latency": {stage: _summarize(values) for stage, values in samples.items()},
+        "errors": {"count": len(errors), "first": errors[:5]},
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--documents", type=int, default=5, help="Documents per workflow")
+    parser.add_argument("--document-size", type=int, default=10_000, help="Bytes per document")
+    parser.add_argument("--records-per-document", type=int, default=10)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--worker-concurrency", type=int, default=4)
+    parser.add_argument("--mock-delay-ms", type=int, default=0)
+    parser.add_argument("--poll-interval-ms", type=int, default=50)
+    parser.add_argument("--poll-wait-seconds", type=int, default=5)
+    parser.add_argument(
+        "--database-url",
+        default=None,
+        help="Run against this database instead of a temporary SQLite file",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Use the in-memory repositories instead of a database",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Write JSON here")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench-workflow-") as work_dir:
+        _configure_environment(args, Path(work_dir))
+        report = asyncio.run(main(args))
+
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(rendered + "\n")
+    print(rendered)
@@ -1,28 +1,68 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 
-from app.api import documents_router, extractions_router
+from app.api import (
+    documents_router,
+    extractions_router,
+    limit_upload_size,
+    metrics_router,
+    records_router,
+)
 from app.core.config import get_settings
 from app.core.exception_handlers import (
+    document_too_large_handler,
     document_upload_error_handler,
+    extraction_queue_full_handler,
     not_found_handler,
     validation_error_handler,
 )
-from app.core.exceptions import DocumentUploadError, NotFoundError, ValidationError
-from app.db import engine
+from app.core.exceptions import (
+    DocumentTooLargeError,
+    DocumentUploadError,
+    ExtractionQueueFullError,
+    NotFoundError,
+    ValidationError,
+)
+from app.core.metrics import register_pool_metrics, track_request_latency
+from app.db import dispose_engines, engine, init_db, replica_engines, worker_engine
+from app.extractors import shutdown_process_pool
+from app.services import status_events
+from app.workers import run_worker
 
 settings = get_settings()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    async with engine.begin() as conn:
-        await conn.execute(text("SELECT 1"))
+    if engine is not None:
+        async with engine.begin() as conn:
+            await conn.execute(text("SELECT 1"))
+    await init_db()
+
+    background_tasks: list[asyncio.Task] = []
+    worker_stop = asyncio.Event()
+    worker_task: asyncio.Task | None = None
+    if settings.STATUS_EVENTS_BACKEND == "postgres":
+        background_tasks.append(asyncio.create_task(status_events.run_listener()))
+    if settings.EMBEDDED_WORKER:
+        worker_task = asyncio.create_task(run_worker(worker_stop))
+
     yield
-    await engine.dispose()
+
+    # Let the embedded worker drain (and checkpoint leftovers) while the
+    # engine is still usable
+    worker_stop.set()
+    if worker_task is not None:
+        await asyncio.gather(worker_task, return_exceptions=True)
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await asyncio.to_thread(shutdown_process_pool)
+    await dispose_engines()
 
 
 app = FastAPI(
@@ -39,15 +79,29 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.middleware("http")(limit_upload_size)
+app.middleware("http")(track_request_latency)
+if engine is not None:
+    register_pool_metrics(
+        {
+            "api": engine,
+            "worker": worker_engine,
+            **{f"replica_{i}": replica for i, replica in enumerate(replica_engines)},
+        }
+    )
 
 # Register exception handlers
 app.add_exception_handler(NotFoundError, not_found_handler)
 app.add_exception_handler(ValidationError, validation_error_handler)
 app.add_exception_handler(DocumentUploadError, document_upload_error_handler)
+app.add_exception_handler(DocumentTooLargeError, document_too_large_handler)
+app.add_exception_handler(ExtractionQueueFullError, extraction_queue_full_handler)
 
 # Include API routers
 app.include_router(documents_router)
 app.include_router(extractions_router)
+app.include_router(metrics_router)
+app.include_router(records_router)
 
 
 @app.get("/")
@@ -0,0 +1,58 @@
+import asyncio
+import os
+import tempfile
+from collections.abc import Callable, Coroutine
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+# Settings and engines are created at import time, so configure them before
+# anything under `app` is imported
+_work_dir = Path(tempfile.mkdtemp(prefix="extraction-tests-"))
+os.environ.update(
+    {
+        "APP_NAME": "tests",
+        "APP_DESCRIPTION": "tests",
+        "ENV": "test",
+        "LOG_LEVEL": "WARNING",
+        "DATABASE_BACKEND": "sqlite",
+        "SQLITE_PATH": str(_work_dir / "tests.db"),
+        "STORAGE_DIR": str(_work_dir / "storage"),
+        "STATUS_EVENTS_BACKEND": "memory",
+        "MOCK_AI_DELAY_MS": "0",
+        "RECORDS_PER_DOCUMENT": "2",
+    }
+)
+
+import app.models  # noqa: E402, F401 - registers every table on Base.metadata
+from app.db import dispose_engines, engine  # noqa: E402
+from app.db.base import Base  # noqa: E402
+
+
+@pytest.fixture
+def run() -> Callable[[Coroutine[Any, Any, Any]], Any]:
+    """Run a coroutine in a fresh event loop, closing pooled connections after."""
+
+    def _run(coro: Coroutine[Any, Any, Any]) -> Any:
+        async def main() -> Any:
+            try:
+                return await coro
+            finally:
+                await dispose_engines()
+
+        return asyncio.run(main())
+
+    return _run
+
+
+@pytest.fixture(autouse=True)
+def database(run) -> None:
+    """Start every test from an empty schema."""
+
+    async def reset() -> None:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+
+    run(reset())
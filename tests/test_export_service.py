@@ -0,0 +1,67 @@
+import csv
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+from app.db import async_session_factory
+from app.models import Document, Extraction
+from app.repositories import extraction_repository
+from app.services import export_service
+
+_RECORDS = [
+    {"field": "total", "value": "10", "confidence": 0.9},
+    {"field": "vendor", "value": "ACME", "confidence": "high"},
+    {"field": "flag", "value": "yes", "confidence": True},
+    {"field": "date", "value": "2024-01-01"},
+]
+
+
+async def _store_records(payloads: list[dict]) -> UUID:
+    async with async_session_factory() as db:
+        document = Document(
+            filename="doc.pdf",
+            file_path="unused",
+            content_hash="hash",
+            content_type="application/pdf",
+            size_bytes=1,
+        )
+        extraction = Extraction(total_documents=1)
+        db.add_all([document, extraction])
+        await db.flush()
+        await extraction_repository.bulk_insert_records(
+            [
+                {"extraction_id": extraction.id, "document_id": document.id, "data": data}
+                for data in payloads
+            ],
+            db,
+        )
+        await db.commit()
+        return extraction.id
+
+
+async def _export(output: Path, export_format: str) -> int:
+    extraction_id = await _store_records(_RECORDS)
+    async with async_session_factory() as db:
+        return await export_service.export_records(extraction_id, output, export_format, db)
+
+
+def test_csv_export_writes_null_for_non_numeric_confidence(run, tmp_path):
+    output = tmp_path / "records.csv"
+
+    assert run(_export(output, "csv")) == len(_RECORDS)
+
+    with open(output, newline="", encoding="utf-8") as f:
+        confidences = {row["field"]: row["confidence"] for row in csv.DictReader(f)}
+    assert confidences == {"total": "0.9", "vendor": "", "flag": "", "date": ""}
+
+
+def test_parquet_export_writes_null_for_non_numeric_confidence(run, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    output = tmp_path / "records.parquet"
+
+    assert run(_export(output, "parquet")) == len(_RECORDS)
+
+    table = pq.read_table(output)
+    confidences = dict(zip(table["field"].to_pylist(), table["confidence"].to_pylist()))
+    assert confidences == {"total": 0.9, "vendor": None, "flag": None, "date": None}
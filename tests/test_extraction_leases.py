@@ -0,0 +1,226 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+from sqlalchemy import func, select, update
+
+from app.db import async_session_factory
+from app.models import Document, Extraction, ExtractionRecord, ExtractionStatus
+from app.services import extraction_service
+from app.workers.extraction_worker import _drain, _heartbeat
+
+
+async def _enqueue_job(documents: int = 2) -> UUID:
+    async with async_session_factory() as db:
+        docs = [
+            Document(
+                filename=f"doc-{i}.pdf",
+                file_path="unused",
+                content_hash=uuid4().hex,
+                content_type="application/pdf",
+                size_bytes=1,
+            )
+            for i in range(documents)
+        ]
+        db.add_all(docs)
+        await db.flush()
+        extraction = await extraction_service.create_extraction(
+            [doc.id for doc in docs], db
+        )
+        await db.commit()
+        return extraction.id
+
+
+async def _expire_lease(extraction_id: UUID) -> None:
+    past = datetime.now(timezone.utc) - timedelta(seconds=1)
+    async with async_session_factory() as db:
+        await db.execute(
+            update(Extraction)
+            .where(Extraction.id == extraction_id)
+            .values(lease_expires_at=past)
+        )
+        await db.commit()
+
+
+async def _skip_backoff(extraction_id: UUID) -> None:
+    async with async_session_factory() as db:
+        await db.execute(
+            update(Extraction)
+            .where(Extraction.id == extraction_id)
+            .values(next_attempt_at=None)
+        )
+        await db.commit()
+
+
+async def _steal_lease(extraction_id: UUID) -> UUID:
+    """Let the lease expire, reap the job and claim it again, as another worker would."""
+    await _expire_lease(extraction_id)
+    assert await extraction_service.reap_expired_leases() == 1
+    await _skip_backoff(extraction_id)
+    claimed = await extraction_service.claim_pending_extractions(10)
+    return claimed[extraction_id]
+
+
+async def _load(extraction_id: UUID) -> tuple[Extraction, int]:
+    async with async_session_factory() as db:
+        extraction = await db.get(Extraction, extraction_id)
+        records = await db.scalar(
+            select(func.count())
+            .select_from(ExtractionRecord)
+            .where(ExtractionRecord.extraction_id == extraction_id)
+        )
+        return extraction, records
+
+
+def test_expired_lease_is_reaped_and_reclaimed_with_new_token(run):
+    async def scenario() -> None:
+        extraction_id = await _enqueue_job()
+        first = await extraction_service.claim_pending_extractions(10)
+        assert set(first) == {extraction_id}
+
+        # A live lease is left alone
+        assert await extraction_service.reap_expired_leases() == 0
+
+        await _expire_lease(extraction_id)
+        assert await extraction_service.reap_expired_leases() == 1
+        extraction, _ = await _load(extraction_id)
+        assert extraction.status == ExtractionStatus.PENDING
+        assert extraction.lease_token is None
+        assert extraction.next_attempt_at is not None
+
+        # Backoff first, then a new claim with a new token
+        assert await extraction_service.claim_pending_extractions(10) == {}
+        await _skip_backoff(extraction_id)
+        second = await extraction_service.claim_pending_extractions(10)
+        assert set(second) == {extraction_id}
+        assert second[extraction_id] != first[extraction_id]
+        extraction, _ = await _load(extraction_id)
+        assert extraction.attempts == 2
+
+    run(scenario())
+
+
+def test_stale_worker_cannot_renew_or_process_reclaimed_job(run):
+    async def scenario() -> None:
+        extraction_id = await _enqueue_job()
+        stale_token = (await extraction_service.claim_pending_extractions(10))[
+            extraction_id
+        ]
+        current_token = await _steal_lease(extraction_id)
+
+        assert await extraction_service.renew_leases({extraction_id: stale_token}) == set()
+        assert await extraction_service.renew_leases(
+            {extraction_id: current_token}
+        ) == {extraction_id}
+
+        await extraction_service.process_extraction(extraction_id, stale_token)
+        extraction, records = await _load(extraction_id)
+        assert extraction.status == ExtractionStatus.PROCESSING
+        assert extraction.lease_token == current_token
+        assert records == 0
+
+        await extraction_service.process_extraction(extraction_id, current_token)
+        extraction, records = await _load(extraction_id)
+        assert extraction.status == ExtractionStatus.COMPLETED
+        assert extraction.total_records == records == 4
+
+    run(scenario())
+
+
+def test_run_that_loses_its_lease_midway_writes_nothing(run, monkeypatch):
+    # The stolen claim writes from another session while the batch is open
+    monkeypatch.setattr(extraction_service.settings, "RESULT_CACHE_ENABLED", False)
+    extract_batch = extraction_service._extract_batch
+    stolen: dict[str, UUID] = {}
+
+    async def extract_then_lose_lease(extraction_id, *args, **kwargs):
+        results = await extract_batch(extraction_id, *args, **kwargs)
+        stolen["token"] = await _steal_lease(extraction_id)
+        return results
+
+    monkeypatch.setattr(extraction_service, "_extract_batch", extract_then_lose_lease)
+
+    async def scenario() -> None:
+        extraction_id = await _enqueue_job()
+        token = (await extraction_service.claim_pending_extractions(10))[extraction_id]
+
+        await extraction_service.process_extraction(extraction_id, token)
+        extraction, records = await _load(extraction_id)
+        assert extraction.status == ExtractionStatus.PROCESSING
+        assert extraction.lease_token == stolen["token"]
+        assert extraction.total_records == records == 0
+
+    run(scenario())
+
+
+def test_heartbeat_renews_held_leases_and_cancels_lost_jobs(run, monkeypatch):
+    monkeypatch.setattr(extraction_service.settings, "JOB_HEARTBEAT_SECONDS", 0.01)
+
+    async def scenario() -> None:
+        kept_id = await _enqueue_job()
+        lost_id = await _enqueue_job()
+        leases = await extraction_service.claim_pending_extractions(10)
+        claimed, _ = await _load(kept_id)
+        await _steal_lease(lost_id)
+
+        running = {
+            kept_id: asyncio.create_task(asyncio.sleep(60)),
+            lost_id: asyncio.create_task(asyncio.sleep(60)),
+        }
+        heartbeat = asyncio.create_task(_heartbeat(leases, running))
+        await asyncio.sleep(0.3)
+        heartbeat.cancel()
+
+        assert set(leases) == {kept_id}
+        assert running[lost_id].cancelled()
+        assert not running[kept_id].done()
+        running[kept_id].cancel()
+
+        kept, _ = await _load(kept_id)
+        assert kept.lease_expires_at > claimed.lease_expires_at
+
+    run(scenario())
+
+
+def test_release_only_puts_back_jobs_still_leased_to_this_worker(run):
+    async def scenario() -> None:
+        own_id = await _enqueue_job()
+        lost_id = await _enqueue_job()
+        leases = await extraction_service.claim_pending_extractions(10)
+        current_token = await _steal_lease(lost_id)
+
+        assert await extraction_service.release_extractions(leases) == 1
+
+        own, _ = await _load(own_id)
+        assert own.status == ExtractionStatus.PENDING
+        assert own.attempts == 0
+        assert own.lease_token is None
+        lost, _ = await _load(lost_id)
+        assert lost.status == ExtractionStatus.PROCESSING
+        assert lost.attempts == 2
+        assert lost.lease_token == current_token
+
+    run(scenario())
+
+
+def test_drain_releases_queued_jobs_and_waits_only_for_running_ones(run):
+    async def scenario() -> None:
+        running_id = await _enqueue_job()
+        queued_id = await _enqueue_job()
+        leases = await extraction_service.claim_pending_extractions(10)
+        queue: asyncio.Queue[UUID] = asyncio.Queue()
+        queue.put_nowait(queued_id)
+        running = {running_id: asyncio.create_task(asyncio.sleep(0.05))}
+
+        await _drain(queue, leases, running)
+
+        assert queue.empty()
+        assert running[running_id].done()
+        assert set(leases) == {running_id}
+        queued, _ = await _load(queued_id)
+        assert queued.status == ExtractionStatus.PENDING
+        assert queued.lease_token is None
+        still_running, _ = await _load(running_id)
+        assert still_running.status == ExtractionStatus.PROCESSING
+
+    run(scenario())
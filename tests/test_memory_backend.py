@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.db.memory import MemorySession, MemoryStore
+from app.models import Document, Extraction, ExtractionStatus
+from app.repositories import memory
+from app.services import extraction_service, result_cache, status_events
+
+
+@pytest.fixture
+def session_factory(monkeypatch) -> partial[MemorySession]:
+    """Run the extraction service on the memory repositories and a fresh store."""
+    factory = partial(MemorySession, MemoryStore())
+    monkeypatch.setattr(extraction_service, "worker_session_factory", factory)
+    monkeypatch.setattr(
+        extraction_service, "extraction_repository", memory.extraction_repository
+    )
+    monkeypatch.setattr(extraction_service, "document_repository", memory.document_repository)
+    monkeypatch.setattr(
+        result_cache, "extraction_cache_repository", memory.extraction_cache_repository
+    )
+    result_cache._memory.clear()
+    return factory
+
+
+async def _enqueue_job(factory: partial[MemorySession], documents: int = 2) -> UUID:
+    async with factory() as db:
+        docs = [
+            Document(
+                filename=f"doc-{i}.pdf",
+                file_path="unused",
+                content_hash=uuid4().hex,
+                content_type="application/pdf",
+                size_bytes=1,
+            )
+            for i in range(documents)
+        ]
+        db.add_all(docs)
+        await db.flush()
+        extraction = await extraction_service.create_extraction(
+            [doc.id for doc in docs], db
+        )
+        await db.commit()
+        return extraction.id
+
+
+def test_job_is_claimed_processed_and_paginated(run, session_factory):
+    async def scenario() -> None:
+        extraction_id = await _enqueue_job(session_factory, documents=3)
+        leases = await extraction_service.claim_pending_extractions(10)
+        assert set(leases) == {extraction_id}
+
+        async with status_events.broadcaster.subscribe(extraction_id) as events:
+            await extraction_service.process_extraction(extraction_id, leases[extraction_id])
+            assert events.get_nowait() == ExtractionStatus.COMPLETED
+
+        async with session_factory() as db:
+            first = await extraction_service.get_extraction_records(extraction_id, db, limit=4)
+            second = await extraction_service.get_extraction_records(
+                extraction_id, db, limit=4, cursor=first.next_cursor
+            )
+        assert first.status == ExtractionStatus.COMPLETED
+        assert first.total_records == 6
+        assert len(first.records) == 4 and first.next_cursor
+        assert len(second.records) == 2 and second.next_cursor is None
+        assert {r.id for r in first.records}.isdisjoint(r.id for r in second.records)
+
+    run(scenario())
+
+
+def test_run_that_loses_its_lease_midway_writes_nothing(run, session_factory, monkeypatch):
+    extract_batch = extraction_service._extract_batch
+    stolen: dict[str, UUID] = {}
+
+    async def extract_then_lose_lease(extraction_id, *args, **kwargs):
+        results = await extract_batch(extraction_id, *args, **kwargs)
+        async with session_factory() as db:
+            extraction = await db.get(Extraction, extraction_id)
+            extraction.lease_expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+            await db.commit()
+        assert await extraction_service.reap_expired_leases() == 1
+        async with session_factory() as db:
+            (await db.get(Extraction, extraction_id)).next_attempt_at = None
+            await db.commit()
+        claimed = await extraction_service.claim_pending_extractions(10)
+        stolen["token"] = claimed[extraction_id]
+        return results
+
+    monkeypatch.setattr(extraction_service, "_extract_batch", extract_then_lose_lease)
+
+    async def scenario() -> None:
+        extraction_id = await _enqueue_job(session_factory)
+        token = (await extraction_service.claim_pending_extractions(10))[extraction_id]
+
+        await extraction_service.process_extraction(extraction_id, token)
+
+        async with session_factory() as db:
+            extraction = await db.get(Extraction, extraction_id)
+            records = await memory.extraction_repository.find_records_paginated(
+                extraction_id, db
+            )
+        assert extraction.status == ExtractionStatus.PROCESSING
+        assert extraction.lease_token == stolen["token"]
+        assert extraction.attempts == 2
+        assert extraction.total_records == len(records) == 0
+
+    run(scenario())
+
+
+def test_writes_are_visible_to_other_sessions_only_once_committed(run, session_factory):
+    async def scenario() -> None:
+        extraction_id = await _enqueue_job(session_factory)
+
+        async with session_factory() as writer, session_factory() as reader:
+            extraction = await writer.get(Extraction, extraction_id)
+            extraction.status = ExtractionStatus.FAILED
+            await memory.extraction_repository.increment_failed_documents(
+                extraction_id, 2, writer
+            )
+            assert await memory.extraction_repository.count_by_status(
+                ExtractionStatus.FAILED, writer
+            ) == 1
+            assert await memory.extraction_repository.count_by_status(
+                ExtractionStatus.FAILED, reader
+            ) == 0
+            await writer.rollback()
+
+            assert (await reader.get(Extraction, extraction_id)).failed_documents == 0
+            await memory.extraction_repository.increment_failed_documents(
+                extraction_id, 1, writer
+            )
+            await writer.commit()
+            await reader.refresh(await reader.get(Extraction, extraction_id))
+            assert (await reader.get(Extraction, extraction_id)).failed_documents == 1
+
+    run(scenario())
@@ -0,0 +1,95 @@
+from uuid import UUID
+
+import pytest
+
+from app.core import InvalidConfidenceRangeError
+from app.db import async_session_factory
+from app.models import Document, Extraction
+from app.repositories import extraction_repository
+from app.services import extraction_service
+
+
+async def _store_records(payloads: list[dict]) -> UUID:
+    async with async_session_factory() as db:
+        document = Document(
+            filename="doc.pdf",
+            file_path="unused",
+            content_hash="hash",
+            content_type="application/pdf",
+            size_bytes=1,
+        )
+        extraction = Extraction(total_documents=1)
+        db.add_all([document, extraction])
+        await db.flush()
+        await extraction_repository.bulk_insert_records(
+            [
+                {"extraction_id": extraction.id, "document_id": document.id, "data": data}
+                for data in payloads
+            ],
+            db,
+        )
+        await db.commit()
+        return extraction.id
+
+
+async def _search_all(field: str, **filters) -> list[dict]:
+    found: list[dict] = []
+    cursor = None
+    async with async_session_factory() as db:
+        while True:
+            page = await extraction_service.search_records(
+                field, db, limit=3, cursor=cursor, **filters
+            )
+            found.extend(record.data for record in page.records)
+            cursor = page.next_cursor
+            if not cursor:
+                return found
+
+
+def test_search_filters_by_value_and_confidence_across_pages(run):
+    async def scenario() -> None:
+        await _store_records(
+            [
+                {"field": "amount", "value": str(i), "confidence": round(0.5 + i / 100, 2)}
+                for i in range(40)
+            ]
+            + [{"field": "vendor", "value": "Acme", "confidence": 0.9}]
+        )
+
+        found = await _search_all("amount", min_confidence=0.6, max_confidence=0.8)
+        assert sorted(int(data["value"]) for data in found) == list(range(10, 31))
+        assert await _search_all("amount", value="7") == [
+            {"field": "amount", "value": "7", "confidence": 0.57}
+        ]
+        assert len(await _search_all("vendor")) == 1
+
+    run(scenario())
+
+
+def test_non_numeric_confidence_is_stored_but_never_matches_a_range(run):
+    async def scenario() -> None:
+        await _store_records(
+            [
+                {"field": "amount", "value": "1", "confidence": "high"},
+                {"field": "amount", "value": "2", "confidence": ""},
+                {"field": "amount", "value": "3"},
+                {"field": "amount", "value": "4", "confidence": 1},
+            ]
+        )
+
+        assert len(await _search_all("amount")) == 4
+        found = await _search_all("amount", min_confidence=0)
+        assert [data["value"] for data in found] == ["4"]
+
+    run(scenario())
+
+
+def test_inverted_confidence_range_is_rejected(run):
+    async def scenario() -> None:
+        async with async_session_factory() as db:
+            with pytest.raises(InvalidConfidenceRangeError):
+                await extraction_service.search_records(
+                    "amount", db, min_confidence=0.9, max_confidence=0.1
+                )
+
+    run(scenario())
@@ -0,0 +1,52 @@
+from main import app, settings
+
+
+async def _post_documents(content_length: int) -> tuple[int, bool]:
+    """Send POST /documents through the app; return the status and whether the body was read."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/documents",
+        "raw_path": b"/documents",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"testserver"),
+            (b"content-type", b"multipart/form-data; boundary=x"),
+            (b"content-length", str(content_length).encode()),
+        ],
+        "client": ("testclient", 1),
+        "server": ("testserver", 80),
+    }
+    body_read = False
+    response_status = 0
+
+    async def receive() -> dict:
+        nonlocal body_read
+        body_read = True
+        return {"type": "http.request", "body": b"--x--\r\n", "more_body": False}
+
+    async def send(message: dict) -> None:
+        nonlocal response_status
+        if message["type"] == "http.response.start":
+            response_status = message["status"]
+
+    await app(scope, receive, send)
+    return response_status, body_read
+
+
+def test_oversized_upload_is_rejected_before_the_body_is_read(run):
+    status, body_read = run(_post_documents(settings.MAX_UPLOAD_REQUEST_BYTES + 1))
+
+    assert status == 413
+    assert not body_read
+
+
+def test_upload_within_the_limit_reaches_the_route(run):
+    status, body_read = run(_post_documents(7))
+
+    assert status != 413
+    assert body_read